@@ -0,0 +1,181 @@
+# সর্টিং ও সার্চিং অ্যালগরিদমের বেঞ্চমার্ক (Benchmark Suite for Sorting and Searching)
+# list.py ও index.py এর bubble_sort, quick_sort, merge_sort, linear_search, binary_search
+# বিভিন্ন সাইজ ও ডিস্ট্রিবিউশনে (random, sorted, reversed, few_unique) চালিয়ে
+# median ও p95 সময় এবং সর্বোচ্চ মেমোরি (tracemalloc) মাপা হয়, ফলাফল JSON এ লেখা হয়।
+# দুটি ভার্শনের JSON তুলনা করে কোনটি ধীর হয়েছে (regression) তা দেখা যায়।
+#
+# ব্যবহার:
+#   python basics/benchmark.py --output before.json
+#   python basics/benchmark.py --output after.json
+#   python basics/benchmark.py --compare before.json after.json
+
+import argparse
+import ast
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# index.py টপ-লেভেলে input() কল করে, তাই মডিউল ইমপোর্ট না করে শুধু দরকারি ফাংশনগুলো সোর্স থেকে নেওয়া হয়
+def load_functions(filename, names):
+    path = os.path.join(HERE, filename)
+    with open(path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=path)
+    nodes = [node for node in tree.body if isinstance(node, ast.FunctionDef) and node.name in names]
+    namespace = {}
+    exec(compile(ast.Module(body=nodes, type_ignores=[]), path, 'exec'), namespace)
+    return {name: namespace[name] for name in names}
+
+def make_data(distribution, size, rng):
+    if distribution == "random":
+        return [rng.randint(0, size * 10) for _ in range(size)]
+    if distribution == "sorted":
+        return list(range(size))
+    if distribution == "reversed":
+        return list(range(size, 0, -1))
+    if distribution == "few_unique":
+        return [rng.randint(0, 9) for _ in range(size)]
+    raise ValueError(f"Unknown distribution: {distribution}")
+
+# prepare() দুটি ফাংশন দেয়: setup() প্রতিটি রানের ইনপুট বানায় (সময় ও মেমোরি মাপার বাইরে),
+# run(input) শুধু অ্যালগরিদমটি চালায়
+def sort_case(func):
+    # bubble_sort ইনপুট বদলে দেয়, তাই প্রতিটি রানের আগে setup() এ নতুন কপি
+    def prepare(data, rng):
+        return (lambda: list(data)), func
+    return prepare
+
+def search_case(func, lookups=200):
+    # একটি সার্চ খুব দ্রুত, তাই একই সর্টেড লিস্টে অনেকগুলো টার্গেট একসাথে মাপা হয়
+    def prepare(data, rng):
+        arr = sorted(data)
+        targets = [rng.choice(arr) for _ in range(lookups)] + [-1]
+        def run(_):
+            for target in targets:
+                func(arr, target)
+        return (lambda: None), run
+    return prepare
+
+def build_cases():
+    lst = load_functions("list.py", ["linear_search", "binary_search", "bubble_sort", "quick_sort", "merge_sort", "merge"])
+    idx = load_functions("index.py", ["binary_search", "bubble_sort"])
+    # (নাম, সোর্স ফাইল, prepare, সর্বোচ্চ সাইজ) - O(n²) অ্যালগরিদম বড় সাইজে চালানো হয় না
+    return [
+        ("bubble_sort", "list.py", sort_case(lst["bubble_sort"]), 2000),
+        ("bubble_sort", "index.py", sort_case(idx["bubble_sort"]), 2000),
+        ("quick_sort", "list.py", sort_case(lst["quick_sort"]), None),
+        ("merge_sort", "list.py", sort_case(lst["merge_sort"]), None),
+        ("linear_search", "list.py", search_case(lst["linear_search"]), 10000),
+        ("binary_search", "list.py", search_case(lst["binary_search"]), None),
+        ("binary_search", "index.py", search_case(idx["binary_search"]), None),
+    ]
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+def measure(setup, run, warmups, repeats):
+    for _ in range(warmups):
+        run(setup())
+    timings = []
+    for _ in range(repeats):
+        data = setup()
+        start = time.perf_counter_ns()
+        run(data)
+        timings.append(time.perf_counter_ns() - start)
+
+    # tracemalloc সময়কে ধীর করে, তাই মেমোরি আলাদা একটি রানে মাপা হয়; ইনপুটের কপি এর আগেই তৈরি
+    data = setup()
+    tracemalloc.start()
+    try:
+        run(data)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        "median_ns": int(statistics.median(timings)),
+        "p95_ns": percentile(timings, 95),
+        "peak_bytes": peak,
+    }
+
+def run_benchmarks(sizes, distributions, warmups=2, repeats=7, seed=42):
+    results = []
+    for name, source, prepare, max_size in build_cases():
+        for distribution in distributions:
+            for size in sizes:
+                if max_size is not None and size > max_size:
+                    continue
+                rng = random.Random(seed)
+                setup, run = prepare(make_data(distribution, size, rng), rng)
+                stats = measure(setup, run, warmups, repeats)
+                results.append({
+                    "algorithm": name,
+                    "source": source,
+                    "distribution": distribution,
+                    "size": size,
+                    "repeats": repeats,
+                    **stats,
+                })
+                print(f"{name:14} {source:9} {distribution:10} {size:>8}  "
+                      f"median {stats['median_ns'] / 1e6:9.3f} ms  p95 {stats['p95_ns'] / 1e6:9.3f} ms  "
+                      f"peak {stats['peak_bytes'] / 1024:9.1f} KiB")
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "warmups": warmups,
+            "repeats": repeats,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+def compare(old_path, new_path, threshold=1.10):
+    # একই (algorithm, source, distribution, size) এর median threshold গুণের বেশি বাড়লে regression
+    def load(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+        return {(r["algorithm"], r["source"], r["distribution"], r["size"]): r for r in report["results"]}
+
+    old, new = load(old_path), load(new_path)
+    regressions = []
+    for key in sorted(old.keys() & new.keys(), key=str):
+        ratio = new[key]["median_ns"] / max(old[key]["median_ns"], 1)
+        if ratio > threshold:
+            regressions.append((key, ratio))
+            print(f"REGRESSION {' '.join(map(str, key))}: {ratio:.2f}x slower")
+    if not regressions:
+        print("No regressions")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the sorting and searching algorithms")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--distributions", nargs="+", default=["random", "sorted", "reversed", "few_unique"])
+    parser.add_argument("--warmups", type=int, default=2)
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="benchmark.json")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"))
+    parser.add_argument("--threshold", type=float, default=1.10)
+    args = parser.parse_args()
+
+    if args.compare:
+        regressions = compare(*args.compare, threshold=args.threshold)
+        raise SystemExit(1 if regressions else 0)
+
+    report = run_benchmarks(args.sizes, args.distributions, args.warmups, args.repeats, args.seed)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -317,6 +317,112 @@ def is_palindrome(s):
     s = s.lower()
     return s == s[::-1]
 
+# বড় ইনপুটের প্যালিনড্রোম (Palindrome for Large Inputs)
+# is_palindrome() lower() ও s[::-1] দিয়ে পুরো স্ট্রিংয়ের দুটি কপি বানায় এবং শুধু হ্যাঁ/না বলে।
+# is_palindrome_fast(): দুই প্রান্ত থেকে দুটি ইনডেক্স ভেতরের দিকে আসে, কোনো পূর্ণ কপি হয় না।
+# str, bytes বা mmap (যেমন বড় জিনোম/লগ ফাইল) সবকিছুতে চলে। alnum_only=True দিলে অক্ষর/সংখ্যা ছাড়া
+# বাকি সব বাদ দেওয়া হয়, normalize="NFC" ইত্যাদি দিলে আগে ইউনিকোড নরমালাইজ করা হয় (তখন একটি কপি হয়)।
+# ফিল্টার না থাকলে block আকারের টুকরো একসাথে তুলনা হয় (C গতিতে), মেমোরি block এর বেশি লাগে না।
+import builtins
+import mmap
+import unicodedata
+
+def _is_alnum_code(ch):
+    return ch.isalnum() if isinstance(ch, str) else (48 <= ch <= 57 or 65 <= ch <= 90 or 97 <= ch <= 122)
+
+def _lower_code(ch):
+    return ch.lower() if isinstance(ch, str) else (ch + 32 if 65 <= ch <= 90 else ch)
+
+def is_palindrome_fast(s, ignore_case=True, alnum_only=False, normalize=None, block=4096):
+    if normalize:
+        s = unicodedata.normalize(normalize, s)
+    i, j = 0, len(s) - 1
+
+    if not alnum_only:
+        while j - i + 1 >= 2 * block:
+            left = s[i:i + block]
+            right = s[j - block + 1:j + 1][::-1]
+            if ignore_case:
+                left, right = left.lower(), right.lower()
+            if left != right:
+                return False
+            i += block
+            j -= block
+
+    while i < j:
+        a, b = s[i], s[j]
+        if alnum_only:
+            if not _is_alnum_code(a):
+                i += 1
+                continue
+            if not _is_alnum_code(b):
+                j -= 1
+                continue
+        if ignore_case:
+            a, b = _lower_code(a), _lower_code(b)
+        if a != b:
+            return False
+        i += 1
+        j -= 1
+    return True
+
+def is_palindrome_file(filename, **options):
+    # ফাইলটি mmap করে বাইট হিসেবে পরীক্ষা (ASCII ডাটার জন্য; মাল্টি-বাইট UTF-8 উল্টালে অর্থ বদলায়)
+    with open(filename, 'rb') as f:
+        if f.seek(0, 2) == 0:
+            return True
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return is_palindrome_fast(mm, **options)
+
+# মানাখার অ্যালগরিদম (Manacher's Algorithm) - O(n)
+# odd[i]: i কেন্দ্রিক বিজোড় দৈর্ঘ্যের সবচেয়ে বড় প্যালিনড্রোমের ব্যাসার্ধ (নিজেসহ)
+# even[i]: i-1 ও i এর মাঝখান কেন্দ্রিক জোড় দৈর্ঘ্যের প্যালিনড্রোমের অর্ধেক দৈর্ঘ্য
+# আগে পাওয়া সবচেয়ে ডানের প্যালিনড্রোম [l, r] এর ভেতরের আয়না থেকে শুরু করায় মোট তুলনা O(n)।
+def _manacher(s):
+    n = len(s)
+    odd = [0] * n
+    l, r = 0, -1
+    for i in range(n):
+        k = 1 if i > r else min(odd[l + r - i], r - i + 1)
+        while i - k >= 0 and i + k < n and s[i - k] == s[i + k]:
+            k += 1
+        odd[i] = k
+        if i + k - 1 > r:
+            l, r = i - k + 1, i + k - 1
+    even = [0] * n
+    l, r = 0, -1
+    for i in range(n):
+        k = 0 if i > r else min(even[l + r - i + 1], r - i + 1)
+        while i - k - 1 >= 0 and i + k < n and s[i - k - 1] == s[i + k]:
+            k += 1
+        even[i] = k
+        if i + k - 1 > r:
+            l, r = i - k, i + k - 1
+    return odd, even
+
+def longest_palindrome(s):
+    if not len(s):
+        return s[:0]
+    odd, even = _manacher(s)
+    start, length = 0, 1
+    for i in range(len(s)):
+        if 2 * odd[i] - 1 > length:
+            start, length = i - odd[i] + 1, 2 * odd[i] - 1
+        if 2 * even[i] > length:
+            start, length = i - even[i], 2 * even[i]
+    return s[start:start + length]
+
+def count_palindromes(s):
+    # সব প্যালিনড্রোমিক সাবস্ট্রিং (অবস্থান আলাদা হলে আলাদা গোনা হয়)
+    # এই ফাইলের শুরুতে sum = x + y বিল্ট-ইন sum কে ঢেকে দেয়, তাই builtins.sum
+    odd, even = _manacher(s)
+    return builtins.sum(odd) + builtins.sum(even)
+
+# টেস্ট কেস
+# print(is_palindrome_fast("A man, a plan, a canal: Panama", alnum_only=True))  # True
+# print(longest_palindrome("forgeeksskeegfor"))                                 # geeksskeeg
+# print(count_palindromes("aaa"))                                               # 6
+
 # ডিজাইন প্যাটার্ন (Design Patterns)
 
 # ১. সিঙ্গেলটন প্যাটার্ন (Singleton Pattern)
@@ -343,10 +449,126 @@ class Cat(Animal):
 
 class AnimalFactory:
     def create_animal(self, animal_type):
-        if animal_type.lower() == "dog":
-            return Dog()
-        elif animal_type.lower() == "cat":
-            return Cat()
+        # if/elif চেইনের বদলে নিচের animal_registry তে একবার ডিকশনারি লুকআপ; অজানা টাইপে আগের মতোই None
+        if animal_type not in animal_registry:
+            return None
+        return animal_registry.create(animal_type)
+
+# ২.১ রেজিস্ট্রি ফ্যাক্টরি (Registry Factory)
+# শত শত টাইপ হলে if/elif চেইন প্রতিটি তুলনায় .lower() ডাকে এবং O(n)। AnimalRegistry তে:
+# - নাম একবার স্বাভাবিক (strip + lower) করে ডিকশনারিতে O(1) লুকআপ
+# - @registry.register("dog") ডেকোরেটর, register("dog", Dog) (ক্লাস বা যেকোনো ফ্যাক্টরি ফাংশন), অথবা
+#   "module:Class" স্ট্রিং দিয়ে রেজিস্টার
+# - স্ট্রিং ও entry point (importlib.metadata) এর মডিউল প্রথমবার সেই টাইপ চাইলে তবেই import হয়,
+#   আর entry point গুলোর তালিকাও প্রথমবার অজানা নাম পেলে তবেই পড়া হয় - তাই স্টার্টআপ দ্রুত থাকে
+# - pooled=True দিলে আর্গুমেন্ট ছাড়া তৈরি অবজেক্ট (Dog/Cat এর মতো স্টেটলেস) একবার বানিয়ে বারবার ফেরত দেয়
+#   (flyweight), stats() এ hits/misses দেখা যায়। অবজেক্টে স্টেট থাকলে pooled ব্যবহার করা যাবে না।
+import importlib
+import threading
+from importlib import metadata
+
+def _normalize_animal_type(name):
+    return name.strip().lower()
+
+def _entry_points(group):
+    eps = metadata.entry_points()
+    # Python 3.10+ এ select(), তার আগে group -> list ডিকশনারি
+    return eps.select(group=group) if hasattr(eps, "select") else eps.get(group, ())
+
+class AnimalRegistry:
+    def __init__(self, entry_point_group=None, pooled=False):
+        self._targets = {}
+        self._pool = {}
+        self._entry_point_group = entry_point_group
+        self._entry_points_loaded = entry_point_group is None
+        self._lock = threading.Lock()
+        self.pooled = pooled
+        self.hits = 0
+        self.misses = 0
+
+    def register(self, name, target=None):
+        # target না দিলে ডেকোরেটর হিসেবে কাজ করে
+        if target is None:
+            def decorator(cls):
+                self.register(name, cls)
+                return cls
+            return decorator
+        with self._lock:
+            key = _normalize_animal_type(name)
+            self._targets[key] = target
+            self._pool.pop(key, None)
+        return target
+
+    def _load_entry_points(self):
+        with self._lock:
+            if self._entry_points_loaded:
+                return
+            for ep in _entry_points(self._entry_point_group):
+                # কোডে রেজিস্টার করা নাম entry point এর চেয়ে অগ্রাধিকার পায়
+                self._targets.setdefault(_normalize_animal_type(ep.name), ep)
+            self._entry_points_loaded = True
+
+    def _resolve(self, key):
+        target = self._targets.get(key)
+        if target is None and not self._entry_points_loaded:
+            self._load_entry_points()
+            target = self._targets.get(key)
+        if not isinstance(target, (str, metadata.EntryPoint)):
+            # ক্লাস বা যেকোনো কলেবল (ফ্যাক্টরি ফাংশন) সরাসরি ব্যবহার হয়
+            return target
+        # লেজি টার্গেট: "module:Class" স্ট্রিং বা EntryPoint - প্রথমবার import করে ক্লাস দিয়ে বদলে রাখা হয়
+        with self._lock:
+            target = self._targets[key]
+            if isinstance(target, str):
+                module, _, attr = target.partition(":")
+                target = getattr(importlib.import_module(module), attr)
+            elif isinstance(target, metadata.EntryPoint):
+                target = target.load()
+            self._targets[key] = target
+        return target
+
+    def __contains__(self, name):
+        return self._resolve(_normalize_animal_type(name)) is not None
+
+    def names(self):
+        self._load_entry_points()
+        return sorted(self._targets)
+
+    def create(self, animal_type, *args, **kwargs):
+        key = _normalize_animal_type(animal_type)
+        cls = self._resolve(key)
+        if cls is None:
+            raise ValueError(f"Unknown animal type: {animal_type}")
+        if not self.pooled or args or kwargs:
+            return cls(*args, **kwargs)
+        with self._lock:
+            instance = self._pool.get(key)
+            if instance is not None:
+                self.hits += 1
+                return instance
+            self.misses += 1
+        instance = cls()
+        with self._lock:
+            return self._pool.setdefault(key, instance)
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "pooled": len(self._pool)}
+
+animal_registry = AnimalRegistry(entry_point_group="basics.animals")
+animal_registry.register("dog", Dog)
+animal_registry.register("cat", Cat)
+
+# @animal_registry.register("cow")
+# class Cow(Animal):
+#     def speak(self):
+#         return "Moo!"
+#
+# animal_registry.register("bird", "zoo.birds:Bird")   # zoo.birds প্রথম create("bird") এ import হবে
+# shared = AnimalRegistry(pooled=True)
+# shared.register("dog", Dog)
+# shared.create("Dog") is shared.create(" dog ")  # True
+# print(shared.stats())  # {'hits': 1, 'misses': 1, 'pooled': 1}
 
 # জেনারেটর (Generator)
 def count_up_to(n):
@@ -360,20 +582,21 @@ def count_up_to(n):
 # ============================================================
 
 # ডেকোরেটরস (Decorators)
+# প্রতি কলে print না করে latency.py এর ফাংশন-প্রতি হিস্টোগ্রামে perf_counter_ns() দিয়ে রেকর্ড হয়।
+# রিকার্সিভ factorial এ শুধু সবচেয়ে বাইরের কলটি মাপা হয়, প্রতিটি লেভেল নয়।
+from latency import instrument
+
 def timer_decorator(func):
-    def wrapper(*args, **kwargs):
-        import time
-        start = time.time()
-        result = func(*args, **kwargs)
-        end = time.time()
-        print(f"{func.__name__} executed in {end-start:.4f} seconds")
-        return result
-    return wrapper
+    return instrument(func)
 
 @timer_decorator
 def factorial(n):
     return 1 if n == 0 else n * factorial(n-1)
 
+# factorial(100)
+# from latency import snapshot
+# print(snapshot()["__main__.factorial"])  # {'count': 1, 'mean_ns': ..., 'p50_ns': ..., 'p95_ns': ..., 'p99_ns': ...}
+
 # জাভাস্ক্রিপ্ট কম্পেরিজন: 
 # function timerDecorator(fn) {
 #   return function(...args) {
@@ -413,6 +636,155 @@ class FileManager:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.file.close()
 
+# হ্যান্ডেল-ক্যাশিং ফাইল ম্যানেজার (Handle-caching File Manager)
+# উপরের FileManager প্রতিটি with ব্লকে ফাইল open ও close করে। অনেক ফাইলে ছোট ছোট রেকর্ড যোগ করলে
+# প্রতিবার open/close সিস্টেম কলের খরচ হয়। PooledFileManager:
+# - ছোট লেখাগুলো প্রতি ফাইলের বাফারে জমিয়ে buffer_size হলে একটি বড় write() এ ডিস্কে পাঠায়;
+#   সব বাফার মিলে max_buffered বাইটের বেশি হলে সবচেয়ে বড় বাফারটি আগেভাগে লেখা হয়
+# - সর্বোচ্চ max_open টি ফাইল হ্যান্ডেল LRU ক্যাশে খোলা রাখে, সীমা ছাড়ালে সবচেয়ে পুরনো হ্যান্ডেলটি বন্ধ করে।
+#   বাফার আর হ্যান্ডেল আলাদা: হ্যান্ডেল বন্ধ হলেও বাফার থাকে, তাই ফাইল বেশি হলেও প্রতি write() এ open/close হয় না
+# - atomic_write(): অস্থায়ী ফাইলে লিখে শেষে os.replace, তাই পাঠক কখনো অর্ধেক লেখা ফাইল দেখে না
+# - open_mmap(): শুধু-পড়ার mmap, ফাইল কপি না করে পড়া যায়
+# - stats(): প্রতি ফাইলে কত বাইট লেখা/ম্যাপ হলো, কতবার flush ও open হলো
+import mmap
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+class PooledFileManager:
+    def __init__(self, max_open=64, buffer_size=1024 * 1024, max_buffered=64 * 1024 * 1024):
+        self.max_open = max_open
+        self.buffer_size = buffer_size
+        self.max_buffered = max_buffered
+        self._handles = OrderedDict()   # path -> খোলা ফাইল, সবচেয়ে পুরনো ব্যবহার আগে (শুধু হ্যান্ডেলের LRU)
+        self._buffers = {}              # path -> জমা লেখা; হ্যান্ডেল বন্ধ হলেও বাফার থেকে যায়
+        self._buffered = 0              # সব বাফারে মোট কত বাইট
+        self._stats = {}
+        self._lock = threading.RLock()
+
+    def _stat(self, path):
+        stat = self._stats.get(path)
+        if stat is None:
+            stat = self._stats[path] = {"bytes_written": 0, "bytes_mapped": 0, "flushes": 0, "opens": 0}
+        return stat
+
+    def _handle(self, path):
+        handle = self._handles.get(path)
+        if handle is not None:
+            self._handles.move_to_end(path)
+            return handle
+        while len(self._handles) >= self.max_open:
+            # সীমা ছাড়ালে শুধু সবচেয়ে পুরনো হ্যান্ডেল বন্ধ হয়; তার বাফার আগের মতোই থাকে
+            self._handles.popitem(last=False)[1].close()
+        handle = self._handles[path] = open(path, 'ab', buffering=0)
+        self._stat(path)["opens"] += 1
+        return handle
+
+    def _flush_path(self, path):
+        buffer = self._buffers.pop(path, None)
+        if not buffer:
+            return
+        self._buffered -= len(buffer)
+        handle = self._handle(path)
+        view = memoryview(buffer)
+        while view:
+            # আনবাফার্ড write() সব বাইট একবারে না-ও লিখতে পারে
+            view = view[handle.write(view):]
+        view.release()
+        stat = self._stat(path)
+        stat["bytes_written"] += len(buffer)
+        stat["flushes"] += 1
+
+    def write(self, path, data):
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        path = os.path.abspath(path)
+        with self._lock:
+            buffer = self._buffers.get(path)
+            if buffer is None:
+                buffer = self._buffers[path] = bytearray()
+            buffer += data
+            self._buffered += len(data)
+            if len(buffer) >= self.buffer_size:
+                self._flush_path(path)
+            # সব বাফার মিলে max_buffered ছাড়ালে সবচেয়ে বড়টি লেখা হয় - একটি write() এ সবচেয়ে বেশি জায়গা খালি হয়
+            while self._buffered > self.max_buffered:
+                self._flush_path(max(self._buffers, key=lambda p: len(self._buffers[p])))
+
+    def _release(self, path):
+        # এই ফাইলের জমা লেখা ডিস্কে পাঠিয়ে হ্যান্ডেল বন্ধ করা
+        self._flush_path(path)
+        handle = self._handles.pop(path, None)
+        if handle is not None:
+            handle.close()
+
+    @contextmanager
+    def atomic_write(self, path, mode='w', encoding='utf-8'):
+        path = os.path.abspath(path)
+        with self._lock:
+            self._release(path)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.' + os.path.basename(path), suffix='.tmp')
+        try:
+            with open(fd, mode, encoding=None if 'b' in mode else encoding) as f:
+                yield f
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        with self._lock:
+            stat = self._stat(path)
+            stat["bytes_written"] += os.path.getsize(path)
+            stat["flushes"] += 1
+
+    @contextmanager
+    def open_mmap(self, path):
+        path = os.path.abspath(path)
+        with self._lock:
+            self._release(path)
+        with open(path, 'rb') as f:
+            # খালি ফাইল mmap করা যায় না (ValueError), তাই খালি bytes
+            if f.seek(0, 2) == 0:
+                yield b''
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with self._lock:
+                    self._stat(path)["bytes_mapped"] += len(mm)
+                yield mm
+
+    def flush(self):
+        with self._lock:
+            for path in list(self._buffers):
+                self._flush_path(path)
+
+    def close(self):
+        with self._lock:
+            self.flush()
+            while self._handles:
+                self._handles.popitem()[1].close()
+
+    def stats(self, path=None):
+        with self._lock:
+            if path is not None:
+                return dict(self._stat(os.path.abspath(path)))
+            return {p: dict(stat) for p, stat in self._stats.items()}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+# with PooledFileManager(max_open=128) as files:
+#     for i in range(100000):
+#         files.write(f"logs/shard_{i % 500}.log", f"record {i}\n")
+#     with files.atomic_write("config.json") as f:
+#         f.write('{"version": 2}')
+#     print(files.stats("logs/shard_0.log"))  # {'bytes_written': ..., 'flushes': ..., 'opens': ...}
+
 # মেটাক্লাস (Metaclasses)
 class SingletonMeta(type):
     _instances = {}
@@ -0,0 +1,292 @@
+# লো-ওভারহেড ল্যাটেন্সি ইনস্ট্রুমেন্টেশন (Low-overhead Latency Instrumentation)
+# index.py ও question.py এর timer_decorator প্রতিটি কলে print করে, time.time() ব্যবহার করে,
+# রিকার্সিভ factorial এ প্রতিটি লেভেলে আলাদা লাইন ছাপে, আর জেনারেটরে শুধু জেনারেটর তৈরির সময় মাপে।
+# এখানে:
+# - perf_counter_ns() দিয়ে ন্যানোসেকেন্ডে মাপা হয়, print এর বদলে ফাংশন-প্রতি হিস্টোগ্রামে রেকর্ড হয়
+#   (প্রতি কলে শুধু একটি deque append, বাকেটে ঢালা হয় পরে একসাথে)
+# - হিস্টোগ্রাম লগ-লিনিয়ার বাকেটের (প্রতি ২ এর ঘাতে ১৬টি বাকেট, ~৬% আপেক্ষিক ত্রুটি), তাই মেমোরি স্থির
+# - হিস্টোগ্রামের নাম "module.qualname" (যেমন "__main__.factorial"), তাই দুই মডিউলের একই নামের
+#   ফাংশন এক হিস্টোগ্রামে মেশে না; instrument(name=...) দিলে সেই নাম
+# - রিকার্সিভ কলে শুধু সবচেয়ে বাইরের কলটি মাপা হয় (ফাংশন, জেনারেটর, কোরুটিন ও async জেনারেটর সবক্ষেত্রে)
+# - জেনারেটরে প্রতিবার next()/send() এ জেনারেটরের ভেতরে কাটানো মোট সময় শেষে একবার রেকর্ড হয়
+#   (ব্যবহারকারী দুটি আইটেমের মাঝে যে সময় নেয় তা বাদ), কোরুটিনে শুরু থেকে শেষ পর্যন্ত পুরো সময়
+# - async জেনারেটরে কোরুটিনের মতোই প্রথম আইটেম চাওয়া থেকে শেষ/বন্ধ হওয়া পর্যন্ত পুরো সময়
+# - snapshot() দিয়ে count/mean/p50/p95/p99, export_json() দিয়ে ফাইলে লেখা যায়
+#
+# ব্যবহার:
+#   from latency import instrument, snapshot
+#
+#   @instrument
+#   def factorial(n): ...
+#
+#   print(snapshot()[f"{__name__}.factorial"]["p99_ns"])
+
+import contextvars
+import functools
+import inspect
+import json
+import threading
+import time
+from bisect import bisect_right
+from collections import deque
+
+SUB_BUCKET_BITS = 4
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+BUCKET_COUNT = SUB_BUCKETS * 62   # ২^৬৪ ন্যানোসেকেন্ড পর্যন্ত
+
+def _bucket_index(value):
+    if value < SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+    return SUB_BUCKETS * (shift + 1) + (value >> shift) - SUB_BUCKETS
+
+def _bucket_bounds(index):
+    if index < SUB_BUCKETS:
+        return index, index
+    shift = index // SUB_BUCKETS - 1
+    low = (SUB_BUCKETS + index % SUB_BUCKETS) << shift
+    return low, low + (1 << shift) - 1
+
+class LatencyHistogram:
+    # record() শুধু একটি deque তে মান যোগ করে (লক ছাড়া, থ্রেড-নিরাপদ); FLUSH_AT টি জমলে বা summary()
+    # চাইলে লক ধরে একসাথে বাকেটে ঢালা হয়। তাই প্রতি কলের খরচ একটি append, মেমোরিও সীমিত থাকে।
+    FLUSH_AT = 4096
+
+    def __init__(self):
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+        self._buffer = deque()
+        self._append = self._buffer.append
+        self._lock = threading.Lock()
+
+    def record(self, value):
+        self._append(value)
+        if len(self._buffer) >= self.FLUSH_AT:
+            self._fold()
+
+    def _fold(self):
+        with self._lock:
+            popleft = self._buffer.popleft
+            # এই মুহূর্তে যতগুলো আছে ততগুলোই নেওয়া হয়; অন্য থ্রেড এর মধ্যে যোগ করলেও কিছু হারায় না
+            values = [popleft() for _ in range(len(self._buffer))]
+            if not values:
+                return
+            # সর্ট করলে একই বাকেটের মানগুলো পাশাপাশি থাকে, তাই প্রতিটি মানের বদলে প্রতিটি বাকেটে একবার bisect
+            values.sort()
+            counts = self.counts
+            i, n = 0, len(values)
+            while i < n:
+                index = _bucket_index(values[i])
+                j = bisect_right(values, _bucket_bounds(index)[1], i)
+                counts[index] += j - i
+                i = j
+            self.count += n
+            self.total_ns += sum(values)
+            if self.min_ns is None or values[0] < self.min_ns:
+                self.min_ns = values[0]
+            self.max_ns = max(self.max_ns, values[-1])
+
+    def clear(self):
+        with self._lock:
+            self._buffer.clear()
+            self.counts = [0] * BUCKET_COUNT
+            self.count = 0
+            self.total_ns = 0
+            self.min_ns = None
+            self.max_ns = 0
+
+    def _percentile(self, pct):
+        if not self.count:
+            return 0
+        rank = max(1, -(-self.count * pct // 100))   # ceil, nearest-rank
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                low, high = _bucket_bounds(index)
+                # বাকেটের মাঝামাঝি মান, তবে দেখা সর্বনিম্ন/সর্বোচ্চের বাইরে নয়
+                return min(max((low + high) // 2, self.min_ns), self.max_ns)
+        return self.max_ns
+
+    def percentile(self, pct):
+        self._fold()
+        with self._lock:
+            return self._percentile(pct)
+
+    def summary(self):
+        self._fold()
+        with self._lock:
+            return {
+                "count": self.count,
+                "total_ns": self.total_ns,
+                "mean_ns": self.total_ns // self.count if self.count else 0,
+                "min_ns": self.min_ns or 0,
+                "max_ns": self.max_ns,
+                "p50_ns": self._percentile(50),
+                "p95_ns": self._percentile(95),
+                "p99_ns": self._percentile(99),
+            }
+
+_histograms = {}
+_registry_lock = threading.Lock()
+
+def histogram(name):
+    hist = _histograms.get(name)
+    if hist is None:
+        with _registry_lock:
+            hist = _histograms.setdefault(name, LatencyHistogram())
+    return hist
+
+# বাইরের কল চলার সময় ভেতরের (রিকার্সিভ) কল মাপা হয় না। ফাংশন ও জেনারেটরের একটি ধাপ মাঝপথে থামে না,
+# তাই কোন থ্রেডগুলোতে বাইরের কল চলছে তার একটি সেটই যথেষ্ট (threading.local বা ContextVar এর চেয়ে সস্তা)।
+# কোরুটিন await এ থেমে একই থ্রেডে অন্য টাস্ককে জায়গা দেয়, তাই সেখানে টাস্ক-প্রতি আলাদা ContextVar।
+def _instrument_function(func, hist):
+    clock = time.perf_counter_ns
+    # hist.record() এর কাজ এখানেই সরাসরি (একটি মেথড কল কম)
+    buffer = hist._buffer
+    append = buffer.append
+    flush_at = hist.FLUSH_AT
+    active = set()
+    get_ident = threading.get_ident
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        ident = get_ident()
+        if ident in active:
+            return func(*args, **kwargs)
+        active.add(ident)
+        start = clock()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            append(clock() - start)
+            active.discard(ident)
+            if len(buffer) >= flush_at:
+                hist._fold()
+    return wrapper
+
+def _instrument_generator(func, hist):
+    clock = time.perf_counter_ns
+    active = set()
+    get_ident = threading.get_ident
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        gen = func(*args, **kwargs)
+        elapsed = 0
+        measured = False
+        sent, thrown = None, None
+        try:
+            while True:
+                # বাইরের একই জেনারেটরের ধাপের ভেতরে চললে (রিকার্সিভ yield from) সময় সেখানেই গোনা হচ্ছে
+                ident = get_ident()
+                nested = ident in active
+                if not nested:
+                    active.add(ident)
+                    start = clock()
+                try:
+                    item = gen.throw(thrown) if thrown is not None else gen.send(sent)
+                except StopIteration as stop:
+                    return stop.value
+                finally:
+                    if not nested:
+                        elapsed += clock() - start
+                        measured = True
+                        active.discard(ident)
+                sent, thrown = None, None
+                try:
+                    sent = yield item
+                except GeneratorExit:
+                    gen.close()
+                    raise
+                except BaseException as exc:
+                    thrown = exc
+        finally:
+            if measured:
+                hist.record(elapsed)
+    return wrapper
+
+def _instrument_coroutine(func, hist):
+    clock = time.perf_counter_ns
+    active = contextvars.ContextVar(f"{func.__module__}.{func.__qualname__}.active", default=False)
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        if active.get():
+            return await func(*args, **kwargs)
+        token = active.set(True)
+        start = clock()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            hist.record(clock() - start)
+            active.reset(token)
+    return wrapper
+
+def _instrument_async_generator(func, hist):
+    clock = time.perf_counter_ns
+    active = contextvars.ContextVar(f"{func.__module__}.{func.__qualname__}.active", default=False)
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        agen = func(*args, **kwargs)
+        start = None
+        outer = False
+        sent, thrown = None, None
+        try:
+            while True:
+                if start is None:
+                    # প্রথম ধাপ বাইরের একই async জেনারেটরের ধাপের ভেতরে চললে সময় সেখানেই গোনা হচ্ছে
+                    outer = not active.get()
+                    start = clock()
+                # async জেনারেটরের নিজস্ব কনটেক্সট নেই, তাই ফ্ল্যাগ শুধু এই ধাপের জন্য, yield এর আগেই ফেরত
+                token = active.set(True)
+                try:
+                    item = await (agen.athrow(thrown) if thrown is not None else agen.asend(sent))
+                except StopAsyncIteration:
+                    return
+                finally:
+                    active.reset(token)
+                sent, thrown = None, None
+                try:
+                    sent = yield item
+                except GeneratorExit:
+                    await agen.aclose()
+                    raise
+                except BaseException as exc:
+                    thrown = exc
+        finally:
+            if outer:
+                hist.record(clock() - start)
+    return wrapper
+
+def instrument(func=None, *, name=None):
+    if func is None:
+        return lambda f: instrument(f, name=name)
+    hist = histogram(name or f"{func.__module__}.{func.__qualname__}")
+    if inspect.isasyncgenfunction(func):
+        return _instrument_async_generator(func, hist)
+    if inspect.isgeneratorfunction(func):
+        return _instrument_generator(func, hist)
+    if inspect.iscoroutinefunction(func):
+        return _instrument_coroutine(func, hist)
+    return _instrument_function(func, hist)
+
+def snapshot():
+    with _registry_lock:
+        items = list(_histograms.items())
+    return {name: hist.summary() for name, hist in items}
+
+def export_json(path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(snapshot(), f, indent=2)
+
+def reset():
+    # ডেকোরেটেড ফাংশনগুলো নিজেদের হিস্টোগ্রাম ধরে রাখে, তাই রেজিস্ট্রি না মুছে শুধু শূন্য করা হয়
+    with _registry_lock:
+        hists = list(_histograms.values())
+    for hist in hists:
+        hist.clear()
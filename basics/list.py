@@ -147,6 +147,106 @@ def binary_search(arr, target):
             right = mid - 1
     return -1
 
+# সর্টেড ইনডেক্স (Sorted Index) - একই সর্টেড অ্যারেতে লাখ লাখ লুকআপের জন্য
+# binary_search() প্রতি কলে একটি মান খোঁজে এবং শুধু সঠিক মিল বা -1 দেয়।
+# SortedIndex দেয়:
+# - lower_bound(x): প্রথম ইনডেক্স যেখানে arr[i] >= x; upper_bound(x): প্রথম ইনডেক্স যেখানে arr[i] > x
+# - find(x): x এর ইনডেক্স বা -1 (ডুপ্লিকেট থাকলে সবচেয়ে বামেরটি; আলাদা মানের অ্যারেতে binary_search() এর সমান)
+# - *_batch(): একসাথে অনেক কী; NumPy থাকলে একটি searchsorted কলে
+# - layout="eytzinger": মানগুলো BFS ক্রমে (রুট 1, নোড k এর চাইল্ড 2k ও 2k+1) সাজানো, ফলে সার্চের
+#   প্রথম কয়েকটি ধাপ সবসময় অ্যারের শুরুর একই জায়গায় পড়ে (ক্যাশ-ফ্রেন্ডলি), লুপে কোনো if শাখা নেই
+import bisect
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class SortedIndex:
+    def __init__(self, arr, layout="sorted"):
+        self.values = list(arr)
+        self.layout = layout
+        if layout == "eytzinger":
+            n = len(self.values)
+            self._eytzinger = [None] * (n + 1)
+            self._position = [n] * (n + 1)   # Eytzinger নোড -> সর্টেড ইনডেক্স; নোড 0 মানে "পাওয়া যায়নি"
+            self._fill_eytzinger()
+        elif layout != "sorted":
+            raise ValueError(f"Unknown layout: {layout}")
+        self._np_values = np.asarray(self.values) if np is not None else None
+
+    def _fill_eytzinger(self):
+        # ইনঅর্ডার ট্রাভার্সালে সর্টেড মানগুলো ক্রমানুসারে বসানো (লুপ দিয়ে, রিকার্শন ছাড়া)
+        n = len(self.values)
+        i = 0
+        stack = []
+        k = 1
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k *= 2
+            k = stack.pop()
+            self._eytzinger[k] = self.values[i]
+            self._position[k] = i
+            i += 1
+            k = 2 * k + 1
+
+    def _eytzinger_bound(self, x, strict):
+        eytzinger, n = self._eytzinger, len(self.values)
+        k = 1
+        if strict:
+            while k <= n:
+                k = 2 * k + (eytzinger[k] <= x)
+        else:
+            while k <= n:
+                k = 2 * k + (eytzinger[k] < x)
+        # শেষের 1 বিটগুলো (ডানে যাওয়া) এবং তার আগের একটি 0 বিট সরালে উত্তরের নোড
+        k >>= (~k & (k + 1)).bit_length()
+        return self._position[k]
+
+    def lower_bound(self, x):
+        if self.layout == "eytzinger":
+            return self._eytzinger_bound(x, strict=False)
+        return bisect.bisect_left(self.values, x)
+
+    def upper_bound(self, x):
+        if self.layout == "eytzinger":
+            return self._eytzinger_bound(x, strict=True)
+        return bisect.bisect_right(self.values, x)
+
+    def find(self, x):
+        i = self.lower_bound(x)
+        return i if i < len(self.values) and self.values[i] == x else -1
+
+    def count(self, lo, hi):
+        # lo <= মান < hi এমন কতগুলো
+        return max(0, self.lower_bound(hi) - self.lower_bound(lo))
+
+    def lower_bound_batch(self, keys):
+        if self._np_values is not None:
+            return np.searchsorted(self._np_values, keys, side='left')
+        return [self.lower_bound(x) for x in keys]
+
+    def upper_bound_batch(self, keys):
+        if self._np_values is not None:
+            return np.searchsorted(self._np_values, keys, side='right')
+        return [self.upper_bound(x) for x in keys]
+
+    def find_batch(self, keys):
+        if self._np_values is not None:
+            keys = np.asarray(keys)
+            n = len(self.values)
+            idx = np.searchsorted(self._np_values, keys, side='left')
+            hit = idx < n
+            hit[hit] = self._np_values[idx[hit]] == keys[hit]
+            return np.where(hit, idx, -1)
+        return [self.find(x) for x in keys]
+
+# টেস্ট কেস
+# index = SortedIndex([1, 3, 3, 5, 7, 9], layout="eytzinger")
+# print(index.find(7), index.lower_bound(3), index.upper_bound(3), index.count(2, 8))  # 4 1 3 4
+# print(list(index.find_batch([1, 4, 9])))                                           # [0, -1, 5]
+
 # ১৪. সর্টিং অ্যালগরিদম (Sorting Algorithms)
 
 # বাবল সর্ট (Bubble Sort) - O(n²)
@@ -195,6 +295,72 @@ def merge(left, right):
     result.extend(right[j:])
     return result
 
+# এক্সটার্নাল মার্জ সর্ট (External Merge Sort) - মেমোরির চেয়ে বড় ডাটার জন্য
+# ইনপুট থেকে memory_limit বাইট পর্যন্ত রেকর্ড নিয়ে মেমোরিতে সর্ট করে অস্থায়ী ফাইলে "রান" হিসেবে লেখা হয়।
+# তারপর heapq.merge দিয়ে সব রান একসাথে k-way মার্জ করা হয় (হিপে প্রতিটি রানের শুধু একটি করে রেকর্ড থাকে)।
+# রান fan_in এর বেশি হলে আগে পাশাপাশি fan_in টি করে রান মার্জ করে কম সংখ্যক বড় রান বানানো হয়।
+# রেকর্ড হলো এক লাইনের স্ট্রিং (ভেতরে '\n' থাকবে না)। সমান key এর রেকর্ডের ক্রম বদলায় না (stable)।
+import heapq
+import sys
+import tempfile
+
+def _write_run(records, tmp_dir, buffer_size):
+    run = tempfile.TemporaryFile('w+', encoding='utf-8', newline='\n', dir=tmp_dir, buffering=buffer_size)
+    run.writelines(record + '\n' for record in records)
+    run.seek(0)
+    return run
+
+def _read_run(run):
+    for line in run:
+        yield line[:-1]
+
+def external_sort(records, key=None, memory_limit=64 * 1024 * 1024, fan_in=64, tmp_dir=None):
+    buffer_size = max(memory_limit // (fan_in + 1), 4096)
+    runs = []
+    batch, used = [], 0
+    try:
+        for record in records:
+            batch.append(record)
+            used += sys.getsizeof(record) + 8   # স্ট্রিং + লিস্টের পয়েন্টার (আনুমানিক)
+            if used >= memory_limit:
+                batch.sort(key=key)
+                runs.append(_write_run(batch, tmp_dir, buffer_size))
+                batch, used = [], 0
+        batch.sort(key=key)
+        if not runs:
+            # সব মেমোরিতে এঁটে গেলে ডিস্কে লেখার দরকার নেই
+            yield from batch
+            return
+        if batch:
+            runs.append(_write_run(batch, tmp_dir, buffer_size))
+        batch = None
+
+        while len(runs) > fan_in:
+            merged_runs = []
+            for i in range(0, len(runs), fan_in):
+                group = runs[i:i + fan_in]
+                merged = heapq.merge(*map(_read_run, group), key=key)
+                merged_runs.append(_write_run(merged, tmp_dir, buffer_size))
+                for run in group:
+                    run.close()
+            runs = merged_runs
+
+        yield from heapq.merge(*map(_read_run, runs), key=key)
+    finally:
+        for run in runs:
+            run.close()
+
+def external_sort_file(input_path, output_path, key=None, **options):
+    buffer_size = 1024 * 1024
+    with open(input_path, 'r', encoding='utf-8', buffering=buffer_size) as src, \
+            open(output_path, 'w', encoding='utf-8', buffering=buffer_size) as dst:
+        records = (line.rstrip('\n') for line in src)
+        dst.writelines(record + '\n' for record in external_sort(records, key=key, **options))
+
+# টেস্ট কেস
+# print(list(external_sort(["banana", "apple", "cherry"], memory_limit=100)))  # ['apple', 'banana', 'cherry']
+# external_sort_file("records.txt", "records.sorted.txt", key=lambda r: r.split(",")[1], memory_limit=256 * 1024 * 1024)
+
 # ১৫. ডাইনামিক প্রোগ্রামিং (Dynamic Programming)
 
 # ফিবোনাচ্চি সিরিজ (Fibonacci Series) - O(n)
@@ -212,6 +378,78 @@ def fibonacci_dp(n):
     
     return fib
 
+# ফাস্ট ডাবলিং ফিবোনাচ্চি (Fast-doubling Fibonacci) - O(log n)
+# উপরের সব ফিবোনাচ্চি ফাংশন লিনিয়ার এবং প্রতিটি পদ তৈরি করে। একটি পদ F(n) লাগলে ডাবলিং সূত্র:
+#   F(2k)   = F(k) · (2·F(k+1) − F(k))
+#   F(2k+1) = F(k)² + F(k+1)²
+# n এর প্রতিটি বিটে একবার এই ধাপ, মোট O(log n) টি বড়-int গুণ।
+# mod দিলে প্রতিটি ধাপে ভাগশেষ নেওয়া হয়, তাই সংখ্যা কখনো m এর চেয়ে বড় হয় না।
+# FibonacciEngine মাঝের (F(k), F(k+1)) জোড়াগুলো একটি সীমিত LRU ক্যাশে রাখে, তাই কাছাকাছি
+# অনেক n এর ব্যাচে (যাদের উপরের বিটগুলো একই) আগের হিসাব আবার কাজে লাগে।
+from collections import OrderedDict
+
+class FibonacciEngine:
+    def __init__(self, cache_size=128, mod=None):
+        self.cache_size = cache_size
+        self.mod = mod
+        self._cache = OrderedDict()   # k -> (F(k), F(k+1))
+
+    def pair(self, n):
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        if n == 0:
+            return (0, 1) if self.mod is None else (0, 1 % self.mod)
+        cached = self._cache.get(n)
+        if cached is not None:
+            self._cache.move_to_end(n)
+            return cached
+        a, b = self.pair(n >> 1)
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if self.mod is not None:
+            c %= self.mod
+            d %= self.mod
+        result = (d, c + d if self.mod is None else (c + d) % self.mod) if n & 1 else (c, d)
+        self._cache[n] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result
+
+    def fib(self, n):
+        return self.pair(n)[0]
+
+    def batch(self, ns):
+        # ছোট থেকে বড় ক্রমে হিসাব করলে একই প্রিফিক্সের জোড়া ক্যাশে থাকতে থাকতেই আবার লাগে
+        ns = list(ns)
+        results = {n: self.fib(n) for n in sorted(set(ns))}
+        return [results[n] for n in ns]
+
+_FIB_ENGINE = FibonacciEngine()
+
+def fibonacci_fast(n):
+    return _FIB_ENGINE.fib(n)
+
+def fibonacci_mod(n, m):
+    # ক্যাশ ছাড়া, n এর বিটগুলো উপর থেকে নিচে
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    a, b = 0, 1 % m
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a) % m
+        d = (a * a + b * b) % m
+        a, b = (d, (c + d) % m) if bit == '1' else (c, d)
+    return a
+
+def fibonacci_batch(ns, mod=None):
+    engine = _FIB_ENGINE if mod is None else FibonacciEngine(mod=mod)
+    return engine.batch(ns)
+
+# টেস্ট কেস
+# print(fibonacci_fast(10))                      # 55
+# print(fibonacci_mod(10**18, 1_000_000_007))
+# print(fibonacci_batch([10, 20, 30]))           # [55, 6765, 832040]
+# print(fibonacci_fast(1_000_000).bit_length())  # 694241
+
 # LCS (Longest Common Subsequence) - O(mn)
 def lcs(str1, str2):
     m, n = len(str1), len(str2)
@@ -226,6 +464,66 @@ def lcs(str1, str2):
     
     return dp[m][n]
 
+# লিনিয়ার মেমোরির LCS (Linear-memory LCS)
+# উপরের lcs() পুরো (m+1)×(n+1) টেবিল রাখে, অথচ প্রতিটি রো শুধু আগের রো এর উপর নির্ভর করে।
+# lcs_length(): দুটি রো দিয়ে দৈর্ঘ্য, ছোট সিকোয়েন্সটি রো হিসেবে নেওয়া হয় - মেমোরি O(min(m, n))
+def lcs_length(str1, str2):
+    if len(str1) < len(str2):
+        str1, str2 = str2, str1
+    return _lcs_last_row(str1, str2)[-1]
+
+def _lcs_last_row(a, b):
+    prev = [0] * (len(b) + 1)
+    for x in a:
+        curr = [0]
+        for j, y in enumerate(b):
+            curr.append(prev[j] + 1 if x == y else max(prev[j + 1], curr[j]))
+        prev = curr
+    return prev
+
+# lcs_sequence(): হির্শবার্গ (Hirschberg) অ্যালগরিদম - আসল সাবসিকোয়েন্সটি রিটার্ন করে, মেমোরি লিনিয়ার।
+# str1 কে মাঝখানে ভাগ করে সামনে থেকে ও পেছন থেকে শেষ রো বের করা হয়, যোগফল সর্বোচ্চ যেখানে
+# সেখানে str2 ভাগ করে দুই অংশ আলাদাভাবে সমাধান করা হয়। সময় এখনও O(mn)।
+def lcs_sequence(str1, str2):
+    def solve(a, b):
+        if not a or not b:
+            return []
+        if len(a) == 1:
+            return [a[0]] if a[0] in b else []
+        mid = len(a) // 2
+        forward = _lcs_last_row(a[:mid], b)
+        backward = _lcs_last_row(a[mid:][::-1], b[::-1])
+        n = len(b)
+        split = max(range(n + 1), key=lambda j: forward[j] + backward[n - j])
+        return solve(a[:mid], b[:split]) + solve(a[mid:], b[split:])
+
+    result = solve(str1, str2)
+    if isinstance(str1, str) and isinstance(str2, str):
+        return ''.join(result)
+    return result
+
+# lcs_bitparallel(): বিট-প্যারালাল (Hyyrö) কার্নেল - বড় ইনপুটের জন্য।
+# str1 এর প্রতিটি পজিশন একটি বিট; str2 এর প্রতিটি এলিমেন্টের জন্য পুরো রো একসাথে কয়েকটি
+# বড় int অপারেশনে (যোগ, বিয়োগ, AND, OR) আপডেট হয়, তাই ইনার লুপ পাইথনে চলে না।
+# V এর m বিটের মধ্যে যতগুলো ০ বিট, LCS এর দৈর্ঘ্য তত।
+def lcs_bitparallel(str1, str2):
+    if len(str1) < len(str2):
+        str1, str2 = str2, str1   # লম্বাটি বিটে, ছোটটির উপর লুপ
+    m = len(str1)
+    match = {}
+    for i, x in enumerate(str1):
+        match[x] = match.get(x, 0) | (1 << i)
+    mask = (1 << m) - 1
+    v = mask
+    for y in str2:
+        u = v & match.get(y, 0)
+        v = ((v + u) | (v - u)) & mask
+    return m - v.bit_count()
+
+# টেস্ট কেস
+# print(lcs("ABCBDAB", "BDCABA"), lcs_length("ABCBDAB", "BDCABA"), lcs_bitparallel("ABCBDAB", "BDCABA"))  # 4 4 4
+# print(lcs_sequence("ABCBDAB", "BDCABA"))  # দৈর্ঘ্য ৪ এর একটি সাবসিকোয়েন্স, যেমন "BDAB"
+
 # ১৬. গ্রাফ অ্যালগরিদম (Graph Algorithms)
 
 # BFS (Breadth First Search) - O(V + E)
@@ -259,6 +557,126 @@ def dfs(graph, start, visited=None):
     
     return result
 
+# CSR গ্রাফ (Compressed Sparse Row Graph)
+# ডিকশনারি-অফ-লিস্ট গ্রাফে প্রতিটি ভার্টেক্সের জন্য আলাদা পাইথন লিস্ট থাকে, আর dfs() রিকার্সিভ বলে
+# গভীর গ্রাফে রিকার্শন লিমিট ছাড়িয়ে যায়। CSR এ ভার্টেক্সগুলো 0..n-1 পূর্ণসংখ্যা আইডি পায় এবং
+# সব এজ দুটি টাইপড array তে থাকে: v এর প্রতিবেশীরা targets[offsets[v]:offsets[v+1]]।
+# সব ট্রাভার্সাল লুপ দিয়ে (রিকার্শন ছাড়া) এবং জেনারেটর হিসেবে লেজি; ফলাফলের ক্রম bfs()/dfs() এর মতোই।
+from array import array
+
+class CSRGraph:
+    def __init__(self, labels, offsets, targets):
+        self.labels = labels                     # আইডি -> আসল ভার্টেক্স
+        self.index = {label: i for i, label in enumerate(labels)}
+        self.offsets = offsets
+        self.targets = targets
+
+    @classmethod
+    def from_dict(cls, graph):
+        labels = list(graph)
+        index = {label: i for i, label in enumerate(labels)}
+        # শুধু প্রতিবেশী হিসেবে আছে এমন ভার্টেক্সও আইডি পায় (তাদের কোনো এজ নেই)
+        for neighbors in graph.values():
+            for w in neighbors:
+                if w not in index:
+                    index[w] = len(labels)
+                    labels.append(w)
+        offsets = array('q', [0])
+        targets = array('q')
+        for label in labels:
+            targets.extend(index[w] for w in graph.get(label, ()))
+            offsets.append(len(targets))
+        return cls(labels, offsets, targets)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def num_edges(self):
+        return len(self.targets)
+
+    def neighbors(self, vertex):
+        v = self.index[vertex]
+        return [self.labels[w] for w in self.targets[self.offsets[v]:self.offsets[v + 1]]]
+
+    def iter_dfs(self, start):
+        offsets, targets, labels = self.offsets, self.targets, self.labels
+        visited = bytearray(len(labels))
+        s = self.index[start]
+        visited[s] = 1
+        yield labels[s]
+        # রিকার্শনের বদলে স্ট্যাক: প্রতিটি ভার্টেক্সের পাশে তার পরের কোন এজটি দেখা বাকি
+        stack = [s]
+        edge = [offsets[s]]
+        while stack:
+            v = stack[-1]
+            i, end = edge[-1], offsets[v + 1]
+            while i < end and visited[targets[i]]:
+                i += 1
+            if i == end:
+                stack.pop()
+                edge.pop()
+                continue
+            edge[-1] = i + 1
+            w = targets[i]
+            visited[w] = 1
+            yield labels[w]
+            stack.append(w)
+            edge.append(offsets[w])
+
+    def iter_bfs(self, *sources):
+        # একাধিক সোর্স দিলে সবগুলো থেকে একসাথে লেভেল ধরে ছড়ায়
+        offsets, targets, labels = self.offsets, self.targets, self.labels
+        visited = bytearray(len(labels))
+        queue = deque()
+        for source in sources:
+            s = self.index[source]
+            if not visited[s]:
+                visited[s] = 1
+                queue.append(s)
+        while queue:
+            v = queue.popleft()
+            yield labels[v]
+            for i in range(offsets[v], offsets[v + 1]):
+                w = targets[i]
+                if not visited[w]:
+                    visited[w] = 1
+                    queue.append(w)
+
+    def dfs(self, start):
+        return list(self.iter_dfs(start))
+
+    def bfs(self, *sources):
+        return list(self.iter_bfs(*sources))
+
+    def connected_components(self):
+        # এজের দিক উপেক্ষা করে (weakly connected) ইউনিয়ন-ফাইন্ড দিয়ে
+        n = len(self.labels)
+        parent = array('q', range(n))
+
+        def find(v):
+            while parent[v] != v:
+                parent[v] = parent[parent[v]]   # পাথ হাফিং
+                v = parent[v]
+            return v
+
+        offsets, targets = self.offsets, self.targets
+        for v in range(n):
+            for i in range(offsets[v], offsets[v + 1]):
+                a, b = find(v), find(targets[i])
+                if a != b:
+                    parent[max(a, b)] = min(a, b)
+
+        components = {}
+        for v in range(n):
+            components.setdefault(find(v), []).append(self.labels[v])
+        return list(components.values())
+
+# টেস্ট কেস
+# g = CSRGraph.from_dict({'A': ['B', 'C'], 'B': ['D'], 'C': ['D'], 'D': [], 'E': ['F']})
+# print(g.bfs('A'), g.dfs('A'))        # ['A', 'B', 'C', 'D'] ['A', 'B', 'D', 'C']
+# print(g.bfs('A', 'E'))               # ['A', 'E', 'B', 'C', 'F', 'D']
+# print(g.connected_components())      # [['A', 'B', 'C', 'D'], ['E', 'F']]
+
 # ১৭. ট্রি অ্যালগরিদম (Tree Algorithms)
 
 # বাইনারি সার্চ ট্রি (Binary Search Tree)
@@ -300,6 +718,193 @@ class BinarySearchTree:
             result.extend(self.inorder_traversal(node.right))
         return result
 
+# সেলফ-ব্যালেন্সিং AVL ট্রি (Self-balancing AVL Tree)
+# উপরের BinarySearchTree এ সর্টেড ইনপুট দিলে ট্রি একটি লিংকড লিস্ট হয়ে যায় এবং রিকার্শন লিমিট ছাড়িয়ে যায়।
+# AVL ট্রি প্রতিটি নোডের দুই পাশের উচ্চতার পার্থক্য সর্বোচ্চ ১ রাখে, তাই উচ্চতা সবসময় O(log n)।
+# insert/delete/search লুপ দিয়ে (রিকার্শন ছাড়া), নোডে __slots__ তাই প্রতি নোডে __dict__ নেই।
+# from_sorted() সর্টেড ডাটা থেকে O(n) সময়ে ব্যালেন্সড ট্রি বানায়, আর ইটারেশন ও range() লেজি।
+class AVLNode:
+    __slots__ = ('value', 'left', 'right', 'height')
+
+    def __init__(self, value):
+        self.value = value
+        self.left = None
+        self.right = None
+        self.height = 1
+
+def _height(node):
+    return node.height if node else 0
+
+def _update_height(node):
+    node.height = 1 + max(_height(node.left), _height(node.right))
+
+def _rotate_right(node):
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update_height(node)
+    _update_height(pivot)
+    return pivot
+
+def _rotate_left(node):
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update_height(node)
+    _update_height(pivot)
+    return pivot
+
+def _rebalance(node):
+    _update_height(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+class AVLTree:
+    def __init__(self):
+        self.root = None
+        self.size = 0
+
+    @classmethod
+    def from_sorted(cls, values):
+        # মাঝের এলিমেন্ট রুট, বাম ও ডান অর্ধেক থেকে সাবট্রি - প্রতিটি এলিমেন্ট একবারই ছোঁয়া হয়
+        values = list(values)
+
+        def build(lo, hi):
+            if lo >= hi:
+                return None
+            mid = (lo + hi) // 2
+            node = AVLNode(values[mid])
+            node.left = build(lo, mid)
+            node.right = build(mid + 1, hi)
+            _update_height(node)
+            return node
+
+        tree = cls()
+        tree.root = build(0, len(values))
+        tree.size = len(values)
+        return tree
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, value):
+        return self.search(value)
+
+    def search(self, value):
+        node = self.root
+        while node:
+            if value == node.value:
+                return True
+            node = node.left if value < node.value else node.right
+        return False
+
+    def _retrace(self, path):
+        # নিচ থেকে উপরে উঠে উচ্চতা আপডেট ও দরকার হলে রোটেশন, তারপর নতুন সাবট্রি প্যারেন্টে বসানো
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            subtree = _rebalance(node)
+            if subtree is not node:
+                if i == 0:
+                    self.root = subtree
+                elif path[i - 1].left is node:
+                    path[i - 1].left = subtree
+                else:
+                    path[i - 1].right = subtree
+
+    def insert(self, value):
+        path = []
+        node = self.root
+        while node:
+            path.append(node)
+            node = node.left if value < node.value else node.right
+        new_node = AVLNode(value)
+        if not path:
+            self.root = new_node
+        elif value < path[-1].value:
+            path[-1].left = new_node
+        else:
+            path[-1].right = new_node
+        self.size += 1
+        self._retrace(path)
+
+    def delete(self, value):
+        path = []
+        node = self.root
+        while node and value != node.value:
+            path.append(node)
+            node = node.left if value < node.value else node.right
+        if node is None:
+            return False
+
+        if node.left and node.right:
+            # দুই চাইল্ড থাকলে ডান সাবট্রির সবচেয়ে ছোট নোডের মান এখানে কপি করে সেই নোডটি মুছি
+            path.append(node)
+            successor = node.right
+            while successor.left:
+                path.append(successor)
+                successor = successor.left
+            node.value = successor.value
+            node = successor
+
+        child = node.left or node.right
+        if not path:
+            self.root = child
+        elif path[-1].left is node:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+        self.size -= 1
+        self._retrace(path)
+        return True
+
+    def __iter__(self):
+        # এক্সপ্লিসিট স্ট্যাক দিয়ে লেজি ইনঅর্ডার - কোনো লিস্ট কপি হয় না
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+
+    def range(self, lo, hi):
+        # lo <= value < hi এমন মানগুলো ক্রমানুসারে; শুধু দরকারি পথ ধরে নামা হয়
+        stack = []
+        node = self.root
+        while node:
+            if node.value >= lo:
+                stack.append(node)
+                node = node.left
+            else:
+                node = node.right
+        while stack:
+            node = stack.pop()
+            if node.value >= hi:
+                return
+            yield node.value
+            node = node.right
+            while node:
+                stack.append(node)
+                node = node.left
+
+    def inorder_traversal(self):
+        return list(self)
+
+# টেস্ট কেস
+# tree = AVLTree.from_sorted(range(1_000_000))
+# tree.insert(-1); tree.delete(500)
+# print(list(tree.range(10, 15)))  # [10, 11, 12, 13, 14]
+
 # ১৮. অ্যাডভান্সড লিস্ট অপারেশনস (Advanced List Operations)
 
 # স্লাইডিং উইন্ডো (Sliding Window)
@@ -325,6 +930,158 @@ def sliding_window_max(arr, k):
     
     return result
 
+# স্ট্রিমিং উইন্ডো অ্যাগ্রিগেটর (Streaming Sliding-window Aggregator)
+# sliding_window_max() শুধু max দেয়, পুরো লিস্ট লাগে এবং সব ফলাফল একটি লিস্টে জমায়।
+# rolling() যেকোনো ইটারেটর থেকে একটি একটি করে মান নেয় এবং একই পাসে একাধিক উইন্ডো সাইজের জন্য
+# max/min (একই মনোটোনিক ডিক), sum/mean (দুই-স্ট্যাক যোগফল) ও আনুমানিক পার্সেন্টাইল
+# (value_range এর মধ্যে bins টি সমান বাকেটের হিস্টোগ্রাম) হিসাব করে, প্রতিটি ফল সাথে সাথে yield করে।
+# প্রতিটি এলিমেন্টে প্রতিটি অ্যাগ্রিগেটের খরচ অ্যামর্টাইজড O(1) (পার্সেন্টাইলে bins এর উপর নির্ভর করে)।
+# শেষ max(window) টি মানই শুধু একটি সার্কুলার বাফারে রাখা হয়।
+
+class _RollingWindow:
+    def __init__(self, size, aggregates, value_range, bins):
+        self.size = size
+        self.aggregates = aggregates
+        self.max_window = deque() if 'max' in aggregates else None
+        self.min_window = deque() if 'min' in aggregates else None
+        # sum/mean: চলমান যোগফল থেকে বেরিয়ে যাওয়া মান বিয়োগ করলে float এর রাউন্ডিং ভুল জমতে থাকে
+        # (1e20 একবার এলে পরের [1, 1] উইন্ডোর যোগফল চিরকাল 0.0)। তাই দুই-স্ট্যাক কিউ: নতুন মান back এ যোগ হয়,
+        # আর front এ প্রতিটি পুরনো মান থেকে শেষ পর্যন্ত সাফিক্স যোগফল - কোনো বিয়োগ নেই, ভুল শুধু উইন্ডোর ভেতরের
+        # মানগুলোর। front খালি হলে back এর সব মান একবারে সরানো হয়, তাই অ্যামর্টাইজড O(1)।
+        self.summing = 'sum' in aggregates or 'mean' in aggregates
+        self.front = []        # সাফিক্স যোগফল, শেষেরটি সবচেয়ে পুরনো মান থেকে
+        self.back = []
+        self.back_total = 0
+        self.percentiles = [(name, float(name[1:])) for name in aggregates if name[0] == 'p']
+        if self.percentiles:
+            if value_range is None:
+                raise ValueError("value_range is required for percentile aggregates")
+            self.low, high = value_range
+            self.bins = bins
+            self.width = (high - self.low) / bins
+            self.counts = [0] * bins
+
+    def total(self):
+        return (self.front[-1] if self.front else 0) + self.back_total
+
+    def _bin(self, value):
+        return min(max(int((value - self.low) / self.width), 0), self.bins - 1)
+
+    def push(self, i, value, leaving):
+        # leaving: উইন্ডো থেকে এইমাত্র বেরিয়ে যাওয়া মান (উইন্ডো এখনো না ভরলে None)
+        if self.max_window is not None:
+            window = self.max_window
+            while window and window[0][0] <= i - self.size:
+                window.popleft()
+            while window and window[-1][1] < value:
+                window.pop()
+            window.append((i, value))
+        if self.min_window is not None:
+            window = self.min_window
+            while window and window[0][0] <= i - self.size:
+                window.popleft()
+            while window and window[-1][1] > value:
+                window.pop()
+            window.append((i, value))
+        if self.summing:
+            if leaving is not None:
+                if not self.front:
+                    total = 0
+                    for v in reversed(self.back):
+                        total += v
+                        self.front.append(total)
+                    self.back.clear()
+                    self.back_total = 0
+                self.front.pop()
+            self.back.append(value)
+            self.back_total += value
+        if self.percentiles:
+            self.counts[self._bin(value)] += 1
+            if leaving is not None:
+                self.counts[self._bin(leaving[0])] -= 1
+
+    def result(self):
+        out = {}
+        for name in self.aggregates:
+            if name == 'max':
+                out[name] = self.max_window[0][1]
+            elif name == 'min':
+                out[name] = self.min_window[0][1]
+            elif name == 'sum':
+                out[name] = self.total()
+            elif name == 'mean':
+                out[name] = self.total() / self.size
+        for name, pct in self.percentiles:
+            rank = max(1, -(-self.size * pct // 100))
+            seen = 0
+            for b, count in enumerate(self.counts):
+                seen += count
+                if seen >= rank:
+                    out[name] = self.low + (b + 0.5) * self.width   # বাকেটের মাঝের মান
+                    break
+        return out
+
+def rolling(iterable, windows, value_range=None, bins=100):
+    # windows: {উইন্ডো সাইজ: ('max', 'min', 'sum', 'mean', 'p50', 'p95', ...)}
+    # প্রতিটি মানের পরে yield: {সাইজ: {অ্যাগ্রিগেট: মান}} - শুধু যেসব উইন্ডো ভরে গেছে
+    states = [_RollingWindow(size, tuple(aggs), value_range, bins) for size, aggs in windows.items() if size > 0]
+    if not states:
+        return
+    capacity = max(state.size for state in states)
+    ring = [None] * capacity
+    for i, value in enumerate(iterable):
+        results = {}
+        for state in states:
+            leaving = (ring[(i - state.size) % capacity],) if i >= state.size else None
+            state.push(i, value, leaving)
+            if i >= state.size - 1:
+                results[state.size] = state.result()
+        ring[i % capacity] = value
+        if results:
+            yield results
+
+# NumPy ব্যাচ পাথ: পুরো অ্যারে একবারে, পাইথন লুপ ছাড়া।
+# max/min: ভ্যান হার্ক/গিল-ওয়ারম্যান পদ্ধতি - k সাইজের ব্লকে প্রিফিক্স ও সাফিক্স max, মোট O(n)
+# sum/mean: cumsum থেকে O(n); পার্সেন্টাইল এখানে আনুমানিক নয়, সঠিক (O(n·k))
+def _block_extreme(arr, k, ufunc, fill):
+    n = len(arr)
+    blocks = -(-n // k)
+    padded = np.full(blocks * k, fill, dtype=arr.dtype)
+    padded[:n] = arr
+    shaped = padded.reshape(blocks, k)
+    prefix = ufunc.accumulate(shaped, axis=1).ravel()
+    suffix = ufunc.accumulate(shaped[:, ::-1], axis=1)[:, ::-1].ravel()
+    return ufunc(suffix[:n - k + 1], prefix[k - 1:n])
+
+def rolling_numpy(arr, window, aggregates=('max', 'min', 'sum', 'mean')):
+    if np is None:
+        raise ImportError("rolling_numpy requires NumPy")
+    arr = np.asarray(arr)
+    if window <= 0 or len(arr) < window:
+        return {name: arr[:0] for name in aggregates}
+    out = {}
+    for name in aggregates:
+        if name == 'max':
+            fill = -np.inf if arr.dtype.kind == 'f' else np.iinfo(arr.dtype).min
+            out[name] = _block_extreme(arr, window, np.maximum, fill)
+        elif name == 'min':
+            fill = np.inf if arr.dtype.kind == 'f' else np.iinfo(arr.dtype).max
+            out[name] = _block_extreme(arr, window, np.minimum, fill)
+        elif name in ('sum', 'mean'):
+            csum = np.concatenate(([0], np.cumsum(arr)))
+            sums = csum[window:] - csum[:-window]
+            out[name] = sums if name == 'sum' else sums / window
+        elif name[0] == 'p':
+            view = np.lib.stride_tricks.sliding_window_view(arr, window)
+            out[name] = np.percentile(view, float(name[1:]), axis=1)
+    return out
+
+# টেস্ট কেস
+# stream = iter([1, 3, -1, -3, 5, 3, 6, 7])
+# for r in rolling(stream, {3: ('max', 'mean'), 5: ('min', 'p50')}, value_range=(-10, 10)):
+#     print(r)  # {3: {'max': 3, 'mean': 1.0}} ... তারপর 5 নম্বর উইন্ডোও যোগ হয়
+# print(rolling_numpy(np.array([1, 3, -1, -3, 5, 3, 6, 7]), 3, ('max',)))  # {'max': array([3, 3, 5, 5, 6, 7])}
+
 # টু পয়েন্টার টেকনিক (Two Pointer Technique)
 def two_sum(arr, target):
     left, right = 0, len(arr) - 1
@@ -340,6 +1097,102 @@ def two_sum(arr, target):
     
     return []
 
+# হ্যাশ-ইনডেক্সড two_sum/k_sum ইঞ্জিন (Hash-indexed Two-sum/K-sum Engine)
+# two_sum() শুধু সর্টেড লিস্টে কাজ করে এবং প্রতিটি টার্গেটের জন্য পুরো লিস্ট আবার স্ক্যান করে।
+# SumIndex একবারই মান -> পজিশন ডিকশনারি এবং একটি সর্টেড কপি বানায়, তারপর সর্টেড না হলেও
+# যত খুশি টার্গেটের উত্তর দেয়। two_sum_batch() NumPy থাকলে প্রতিটি টার্গেটের জন্য পুরো
+# অ্যারের কমপ্লিমেন্ট একসাথে searchsorted দিয়ে খোঁজে। উত্তর: মূল অ্যারের ইনডেক্স, ছোট থেকে বড়;
+# একাধিক জোড়া থাকলে দুই পথেই একই জোড়া - যার প্রথম ইনডেক্স সবচেয়ে ছোট, তারপর দ্বিতীয়টি সবচেয়ে ছোট।
+class SumIndex:
+    def __init__(self, arr):
+        self.arr = list(arr)
+        self.positions = {}
+        for i, value in enumerate(self.arr):
+            self.positions.setdefault(value, []).append(i)
+        self.order = sorted(range(len(self.arr)), key=self.arr.__getitem__)
+        self.sorted_values = [self.arr[i] for i in self.order]
+        if np is not None:
+            self._np_values = np.asarray(self.sorted_values)
+            self._np_order = np.asarray(self.order)
+
+    def two_sum(self, target):
+        positions = self.positions
+        for value, where in positions.items():
+            other = positions.get(target - value)
+            if other is None:
+                continue
+            if other is where:
+                # একই মান দুবার লাগবে
+                if len(where) > 1:
+                    return [where[0], where[1]]
+                continue
+            return sorted((where[0], other[0]))
+        return []
+
+    def two_sum_batch(self, targets):
+        if np is None or not len(self.arr):
+            return [self.two_sum(target) for target in targets]
+        values, order, n = self._np_values, self._np_order, len(self.arr)
+        results = []
+        for target in targets:
+            complement = target - values
+            j = np.searchsorted(values, complement)
+            # নিজের সাথেই জোড়া না হয় সেজন্য একই পজিশন হলে পরেরটি দেখা হয়
+            j = np.where(j == np.arange(n), j + 1, j)
+            found = j < n
+            found[found] = values[j[found]] == complement[found]
+            if not found.any():
+                results.append([])
+                continue
+            # two_sum() এর মতোই উত্তর: সবচেয়ে ছোট মূল ইনডেক্স, তারপর তার সঙ্গীদের মধ্যে সবচেয়ে ছোটটি।
+            # সর্ট স্থিতিশীল, তাই একই মানের মধ্যে order ছোট থেকে বড় মূল ইনডেক্সে সাজানো
+            k = int(np.argmin(np.where(found, order, n)))
+            lo = int(np.searchsorted(values, complement[k]))
+            partner = int(order[lo]) if order[lo] != order[k] else int(order[lo + 1])
+            results.append(sorted((int(order[k]), partner)))
+        return results
+
+    def k_sum(self, target, k):
+        # সর্টেড মানের উপর k-2 টি লুপ আর শেষে টু-পয়েন্টার: O(n^(k-1))
+        values, order = self.sorted_values, self.order
+
+        def search(start, k, target):
+            if k == 2:
+                left, right = start, len(values) - 1
+                while left < right:
+                    current = values[left] + values[right]
+                    if current == target:
+                        return [left, right]
+                    if current < target:
+                        left += 1
+                    else:
+                        right -= 1
+                return None
+            for i in range(start, len(values) - k + 1):
+                if i > start and values[i] == values[i - 1]:
+                    continue   # একই মান দিয়ে আবার চেষ্টা করার দরকার নেই
+                rest = search(i + 1, k - 1, target - values[i])
+                if rest is not None:
+                    return [i] + rest
+            return None
+
+        if k < 1 or k > len(values):
+            return []
+        if k == 1:
+            where = self.positions.get(target)
+            return [where[0]] if where else []
+        found = search(0, k, target)
+        return sorted(order[i] for i in found) if found else []
+
+    def three_sum(self, target):
+        return self.k_sum(target, 3)
+
+# টেস্ট কেস
+# index = SumIndex([8, 3, 11, 5, 2, 7])
+# print(index.two_sum(10))                  # [0, 4]  (8 + 2)
+# print(index.two_sum_batch([10, 9, 100]))  # [[0, 4], [4, 5], []]
+# print(index.three_sum(20))                # [2, 4, 5]  (11 + 2 + 7)
+
 # ১৯. প্র্যাকটিক্যাল এক্সাম্পল (Practical Examples)
 
 # ১. ডুপ্লিকেট এলিমেন্ট খোঁজা
@@ -352,6 +1205,115 @@ def find_duplicates(arr):
         seen.add(num)
     return list(duplicates)
 
+# ১.১ বিশাল স্ট্রিমে ডুপ্লিকেট (Out-of-core and Probabilistic Duplicate Detection)
+# find_duplicates() এর seen সেটে প্রতিটি আলাদা মান থাকে, তাই শত কোটি আইডির স্ট্রিমে মেমোরি ফুরিয়ে যায়।
+#
+# find_duplicates_external(): সঠিক ফল। প্রতিটি মান তার হ্যাশ অনুযায়ী partitions টি অস্থায়ী ফাইলের একটিতে
+# লেখা হয় (একই মান সবসময় একই ফাইলে), তারপর একবারে একটি ফাইল মেমোরিতে এনে ডুপ্লিকেট বের করা হয়।
+# মেমোরিতে থাকে শুধু একটি পার্টিশনের আলাদা মানগুলো। ডুপ্লিকেটগুলো পার্টিশন ধরে ধরে yield হয়।
+#
+# find_duplicates_approx(): আনুমানিক ফল, স্থির মেমোরি, দ্বিতীয়বার দেখার সাথে সাথেই yield।
+# একটি ব্লুম ফিল্টার (Bloom filter) মনে রাখে কোন মান আগে দেখা গেছে, আরেকটি মনে রাখে কোনগুলো আগেই
+# yield হয়েছে যাতে প্রতিটি ডুপ্লিকেট একবারই আসে - দুটিই error_rate হারে ভুল করতে পারে।
+# min_count > 2 দিলে কাউন্ট-মিন স্কেচ (Count-min sketch) গোনে একটি মান কতবার এসেছে; স্কেচ শুধু বেশি গুনতে
+# পারে, কম নয় (conservative update দিয়ে সেই ভুলও কমানো হয়েছে)।
+import hashlib
+import math
+import pickle
+
+def find_duplicates_external(iterable, partitions=64, tmp_dir=None):
+    spills = [tempfile.TemporaryFile(dir=tmp_dir) for _ in range(partitions)]
+    try:
+        picklers = [pickle.Pickler(spill, protocol=pickle.HIGHEST_PROTOCOL) for spill in spills]
+        for item in iterable:
+            pickler = picklers[hash(item) % partitions]
+            pickler.dump(item)
+            # Pickler একই অবজেক্ট মনে রাখে (memo), বড় স্ট্রিমে মেমোরি না বাড়াতে প্রতিবার মুছে ফেলা হয়
+            pickler.clear_memo()
+
+        for spill in spills:
+            spill.seek(0)
+            unpickler = pickle.Unpickler(spill)
+            seen = set()
+            duplicates = set()
+            while True:
+                try:
+                    item = unpickler.load()
+                except EOFError:
+                    break
+                if item in seen:
+                    if item not in duplicates:
+                        duplicates.add(item)
+                        yield item
+                else:
+                    seen.add(item)
+            spill.close()
+    finally:
+        for spill in spills:
+            spill.close()
+
+def _hash_pair(item):
+    data = item.encode('utf-8') if isinstance(item, str) else repr(item).encode('utf-8')
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+
+class BloomFilter:
+    def __init__(self, capacity, error_rate=0.01):
+        # সর্বোত্তম বিট সংখ্যা m = -n·ln(p)/ln(2)², হ্যাশ ফাংশন k = (m/n)·ln(2)
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def add(self, hashes):
+        # আগে থেকেই থাকলে True; hashes = _hash_pair() এর ফল (ডাবল হ্যাশিং)
+        h1, h2 = hashes
+        present = True
+        for i in range(self.hash_count):
+            bit = (h1 + i * h2) % self.size
+            byte, mask = bit >> 3, 1 << (bit & 7)
+            if not self.bits[byte] & mask:
+                present = False
+                self.bits[byte] |= mask
+        return present
+
+class CountMinSketch:
+    def __init__(self, width, depth=4):
+        # width টি কাউন্টারের depth টি সারি; প্রতিটি মান প্রতি সারিতে একটি কাউন্টারে পড়ে, ফল সর্বনিম্নটি
+        self.width = width
+        self.depth = depth
+        self.rows = [array('I', bytes(4 * width)) for _ in range(depth)]
+
+    def add(self, hashes):
+        # গণনা বাড়িয়ে নতুন আনুমানিক মান রিটার্ন করে। conservative update: শুধু যেসব কাউন্টার
+        # বর্তমান সর্বনিম্ন মানের সমান সেগুলোই বাড়ে, তাই অন্য মানের সাথে সংঘর্ষে কম বাড়তি গোনা হয়
+        h1, h2 = hashes
+        cells = [(row, (h1 + i * h2) % self.width) for i, row in enumerate(self.rows)]
+        estimate = min(row[col] for row, col in cells) + 1
+        for row, col in cells:
+            if row[col] < estimate:
+                row[col] = estimate
+        return estimate
+
+def find_duplicates_approx(iterable, capacity, error_rate=0.01, min_count=2):
+    seen = BloomFilter(capacity, error_rate)
+    reported = BloomFilter(capacity, error_rate)
+    # প্রতিটি সম্ভাব্য আলাদা মানের জন্য প্রতি সারিতে একটি কাউন্টার
+    counts = CountMinSketch(capacity) if min_count > 2 else None
+    for item in iterable:
+        hashes = _hash_pair(item)
+        if not seen.add(hashes):
+            continue   # প্রথমবার দেখা
+        # স্কেচে শুধু দ্বিতীয় বা তার পরের উপস্থিতিগুলো যোগ হয়
+        if counts is not None and counts.add(hashes) < min_count - 1:
+            continue
+        if not reported.add(hashes):
+            yield item
+
+# টেস্ট কেস
+# ids = (i % 1_000_000 for i in range(3_000_000))
+# print(sum(1 for _ in find_duplicates_external(ids)))                      # 1000000
+# print(list(find_duplicates_approx([1, 2, 3, 2, 1, 2], capacity=100)))  # [2, 1]
+
 # ২. সাবঅ্যারে সাম
 def max_subarray_sum(arr):
     max_sum = current_sum = arr[0]
@@ -360,6 +1322,122 @@ def max_subarray_sum(arr):
         max_sum = max(max_sum, current_sum)
     return max_sum
 
+# ২.১ রেঞ্জ কোয়েরি সেগমেন্ট ট্রি (Range-query Segment Tree for Max Subarray Sum)
+# max_subarray_sum() arr[1:] কপি করে, শুধু যোগফল দেয়, আর ডাটা বদলালে বা অন্য রেঞ্জ লাগলে আবার
+# পুরো Kadane চালাতে হয়। MaxSubarrayTree প্রতিটি সেগমেন্টের জন্য মোট যোগফল, সেরা প্রিফিক্স, সেরা
+# সাফিক্স ও সেরা সাবঅ্যারে (শুরু/শেষ ইনডেক্সসহ) রাখে। দুটি পাশাপাশি সেগমেন্ট জোড়া লাগানো যায়:
+# সেরা = max(বামের সেরা, ডানের সেরা, বামের সাফিক্স + ডানের প্রিফিক্স)।
+# নোড অবজেক্ট নেই: ট্রি 1-ভিত্তিক হিপ লেআউটে (নোড i এর চাইল্ড 2i, 2i+1) কয়েকটি ফ্ল্যাট লিস্টে থাকে।
+# query(l, r) ও update(i, value) দুটোই O(log n)। query ফল: (যোগফল, শুরু, শেষ), l ও r সহ।
+_NEG_INF = float('-inf')
+# ফাঁকা সেগমেন্ট: জোড়া লাগালে অন্য পাশ অপরিবর্তিত থাকে
+_EMPTY_SEGMENT = (0, _NEG_INF, -1, _NEG_INF, -1, _NEG_INF, -1, -1)
+
+def _combine_segments(a, b):
+    a_total, a_pre, a_pre_end, a_suf, a_suf_start, a_best, a_lo, a_hi = a
+    b_total, b_pre, b_pre_end, b_suf, b_suf_start, b_best, b_lo, b_hi = b
+    if a_total + b_pre > a_pre:
+        pre, pre_end = a_total + b_pre, b_pre_end
+    else:
+        pre, pre_end = a_pre, a_pre_end
+    if b_total + a_suf > b_suf:
+        suf, suf_start = b_total + a_suf, a_suf_start
+    else:
+        suf, suf_start = b_suf, b_suf_start
+    best, lo, hi = a_best, a_lo, a_hi
+    if a_suf + b_pre > best:
+        best, lo, hi = a_suf + b_pre, a_suf_start, b_pre_end
+    if b_best > best:
+        best, lo, hi = b_best, b_lo, b_hi
+    return (a_total + b_total, pre, pre_end, suf, suf_start, best, lo, hi)
+
+class MaxSubarrayTree:
+    FIELDS = 8
+
+    def __init__(self, arr):
+        self.n = len(arr)
+        size = 1
+        while size < max(self.n, 1):
+            size *= 2
+        self.size = size
+        # প্রতিটি ফিল্ড আলাদা ফ্ল্যাট লিস্টে: total, prefix, prefix_end, suffix, suffix_start, best, best_lo, best_hi
+        self.columns = [[value] * (2 * size) for value in _EMPTY_SEGMENT]
+        for i, value in enumerate(arr):
+            self._store(size + i, self._leaf(i, value))
+        for node in range(size - 1, 0, -1):
+            self._store(node, _combine_segments(self._load(2 * node), self._load(2 * node + 1)))
+
+    @staticmethod
+    def _leaf(i, value):
+        return (value, value, i, value, i, value, i, i)
+
+    def _load(self, node):
+        return tuple(column[node] for column in self.columns)
+
+    def _store(self, node, segment):
+        for column, value in zip(self.columns, segment):
+            column[node] = value
+
+    def update(self, i, value):
+        if not 0 <= i < self.n:
+            raise IndexError("index out of range")
+        node = self.size + i
+        self._store(node, self._leaf(i, value))
+        node //= 2
+        while node:
+            self._store(node, _combine_segments(self._load(2 * node), self._load(2 * node + 1)))
+            node //= 2
+
+    def query(self, l=0, r=None):
+        if r is None:
+            r = self.n - 1
+        if not 0 <= l <= r < self.n:
+            raise IndexError("invalid range")
+        # নিচ থেকে উপরে: বাম ও ডান দিকের ফল আলাদা রাখা হয় কারণ জোড়া লাগানোর ক্রম গুরুত্বপূর্ণ
+        left, right = _EMPTY_SEGMENT, _EMPTY_SEGMENT
+        lo, hi = l + self.size, r + self.size + 1
+        while lo < hi:
+            if lo & 1:
+                left = _combine_segments(left, self._load(lo))
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                right = _combine_segments(self._load(hi), right)
+            lo //= 2
+            hi //= 2
+        result = _combine_segments(left, right)
+        return result[5], result[6], result[7]
+
+# ২ডি সংস্করণ: সর্বোচ্চ যোগফলের সাবম্যাট্রিক্স (Maximum-sum Submatrix)
+# প্রতিটি (উপরের রো, নিচের রো) জোড়ার কলাম-যোগফলের উপর Kadane: O(rows² · cols)
+# ফল: (যোগফল, উপরের রো, বাম কলাম, নিচের রো, ডান কলাম)
+def max_submatrix_sum(matrix):
+    rows, cols = len(matrix), len(matrix[0])
+    best = (_NEG_INF, -1, -1, -1, -1)
+    for top in range(rows):
+        column_sums = [0] * cols
+        for bottom in range(top, rows):
+            row = matrix[bottom]
+            for c in range(cols):
+                column_sums[c] += row[c]
+            current, start = 0, 0
+            for c, value in enumerate(column_sums):
+                if current <= 0:
+                    current, start = value, c
+                else:
+                    current += value
+                if current > best[0]:
+                    best = (current, top, start, bottom, c)
+    return best
+
+# টেস্ট কেস
+# tree = MaxSubarrayTree([-2, 1, -3, 4, -1, 2, 1, -5, 4])
+# print(tree.query())       # (6, 3, 6)  -> [4, -1, 2, 1]
+# print(tree.query(0, 2))   # (1, 1, 1)
+# tree.update(7, 5)
+# print(tree.query())       # (15, 3, 8)
+# print(max_submatrix_sum([[1, -2], [-3, 4]]))  # (4, 1, 1, 1, 1)
+
 # ৩. ম্যাট্রিক্স রোটেশন
 def rotate_matrix(matrix):
     n = len(matrix)
@@ -370,4 +1448,122 @@ def rotate_matrix(matrix):
     # প্রতিটি রো রিভার্স
     for i in range(n):
         matrix[i].reverse()
-    return matrix
\ No newline at end of file
+    return matrix
+
+# ৩.১ অ্যারে-ভিত্তিক ম্যাট্রিক্স (Array-backed Matrix)
+# rotate_matrix() লিস্ট-অফ-লিস্টে একটি একটি এলিমেন্ট অদলবদল করে, শুধু বর্গ ম্যাট্রিক্সে এবং শুধু ৯০° ঘড়ির কাঁটার দিকে।
+# Matrix সব মান একটি array('d') বাফারে রাখে; (i, j) এলিমেন্ট থাকে offset + i*row_stride + j*col_stride এ।
+# তাই transpose, ফ্লিপ এবং ৯০/১৮০/২৭০° রোটেশন শুধু offset ও stride বদলানো নতুন ভিউ - কোনো কপি নেই,
+# আয়তাকার ম্যাট্রিক্সেও চলে। দরকার হলে copy() ভিউটিকে block×block টাইলে ভাগ করে নতুন কন্টিগুয়াস বাফারে
+# লেখে (ক্যাশ-ব্লকড), প্রতিটি টাইলের রো array এর স্টেপ-স্লাইস দিয়ে C গতিতে কপি হয়।
+class Matrix:
+    __slots__ = ('data', 'rows', 'cols', 'offset', 'row_stride', 'col_stride')
+
+    def __init__(self, rows, cols, data=None, offset=0, row_stride=None, col_stride=1):
+        self.rows = rows
+        self.cols = cols
+        self.data = data if data is not None else array('d', bytes(8 * rows * cols))
+        self.offset = offset
+        self.row_stride = cols if row_stride is None else row_stride
+        self.col_stride = col_stride
+
+    @classmethod
+    def from_lists(cls, lists):
+        rows, cols = len(lists), len(lists[0]) if lists else 0
+        data = array('d')
+        for row in lists:
+            if len(row) != cols:
+                raise ValueError("All rows must have the same length")
+            data.extend(row)
+        return cls(rows, cols, data)
+
+    def _index(self, i, j):
+        if not (0 <= i < self.rows and 0 <= j < self.cols):
+            raise IndexError("matrix index out of range")
+        return self.offset + i * self.row_stride + j * self.col_stride
+
+    def __getitem__(self, index):
+        return self.data[self._index(*index)]
+
+    def __setitem__(self, index, value):
+        # ভিউতে লিখলে মূল বাফারেও বদলায়
+        self.data[self._index(*index)] = value
+
+    @property
+    def shape(self):
+        return self.rows, self.cols
+
+    def _view(self, rows, cols, offset, row_stride, col_stride):
+        return Matrix(rows, cols, self.data, offset, row_stride, col_stride)
+
+    def transpose(self):
+        return self._view(self.cols, self.rows, self.offset, self.col_stride, self.row_stride)
+
+    def flip_horizontal(self):
+        # প্রতিটি রো উল্টো
+        return self._view(self.rows, self.cols, self.offset + (self.cols - 1) * self.col_stride,
+                          self.row_stride, -self.col_stride)
+
+    def flip_vertical(self):
+        # রোগুলোর ক্রম উল্টো
+        return self._view(self.rows, self.cols, self.offset + (self.rows - 1) * self.row_stride,
+                          -self.row_stride, self.col_stride)
+
+    def rotate(self, quarter_turns=1):
+        # ঘড়ির কাঁটার দিকে quarter_turns × ৯০°; rotate_matrix() এর মতো: transpose তারপর প্রতিটি রো উল্টো
+        quarter_turns %= 4
+        if quarter_turns == 1:
+            return self.transpose().flip_horizontal()
+        if quarter_turns == 2:
+            return self.flip_horizontal().flip_vertical()
+        if quarter_turns == 3:
+            return self.transpose().flip_vertical()
+        return self._view(self.rows, self.cols, self.offset, self.row_stride, self.col_stride)
+
+    def is_contiguous(self):
+        return self.col_stride == 1 and self.row_stride == self.cols and \
+            self.offset == 0 and len(self.data) == self.rows * self.cols
+
+    def _run(self, i, j0, j1):
+        # i নম্বর রো এর [j0, j1) অংশ, একটি স্টেপ-স্লাইসে
+        start = self.offset + i * self.row_stride + j0 * self.col_stride
+        stop = start + (j1 - j0) * self.col_stride
+        return self.data[start:stop if stop >= 0 else None:self.col_stride]
+
+    def row(self, i):
+        return self._run(i, 0, self.cols)
+
+    def copy(self, block=64):
+        rows, cols = self.rows, self.cols
+        out = array('d', bytes(8 * rows * cols))
+        for i0 in range(0, rows, block):
+            i1 = min(i0 + block, rows)
+            for j0 in range(0, cols, block):
+                j1 = min(j0 + block, cols)
+                for i in range(i0, i1):
+                    out[i * cols + j0:i * cols + j1] = self._run(i, j0, j1)
+        return Matrix(rows, cols, out)
+
+    def transpose_blocked(self, block=64):
+        return self.transpose().copy(block)
+
+    def to_lists(self):
+        return [self.row(i).tolist() for i in range(self.rows)]
+
+    def to_numpy(self):
+        # NumPy অ্যারে হিসেবে একই বাফারের ভিউ (কপি ছাড়া)
+        if np is None:
+            raise ImportError("to_numpy requires NumPy")
+        base = np.frombuffer(self.data, dtype=np.float64)
+        return np.lib.stride_tricks.as_strided(
+            base[self.offset:], shape=(self.rows, self.cols),
+            strides=(self.row_stride * 8, self.col_stride * 8))
+
+    def __repr__(self):
+        return f"Matrix({self.to_lists()})"
+
+# টেস্ট কেস
+# m = Matrix.from_lists([[1, 2, 3], [4, 5, 6]])
+# print(m.rotate(1).to_lists())   # [[4.0, 1.0], [5.0, 2.0], [6.0, 3.0]]
+# print(m.rotate(2).to_lists())   # [[6.0, 5.0, 4.0], [3.0, 2.0, 1.0]]
+# print(m.transpose_blocked().is_contiguous())  # True
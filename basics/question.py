@@ -24,6 +24,188 @@ def getEvenNumbers(arr):
     return even_numbers
 print(getEvenNumbers(arr))
 
+# ২.১ লেজি, চাঙ্ক-ভিত্তিক পাইপলাইন (Lazy, Chunked Pipeline)
+# getEvenNumbers এবং map()/filter()/কম্প্রিহেনশন প্রতিটি ধাপে পুরো একটি নতুন লিস্ট বানায়।
+# Pipeline এ filter/map/take ধাপগুলো শুধু জমা হয়, কিছুই চলে না; to_list()/to_array() বা লুপ চালালে
+# ডেটা নির্দিষ্ট সাইজের চাঙ্কে একটি একটি করে সব ধাপ পার হয়, তাই মেমোরিতে একসাথে একটি চাঙ্কই থাকে।
+# - NumPy থাকলে যে চাঙ্কের সব মান int (int64 এ ধরে) বা সব float, সেটি ndarray হয়, আর predicate/ফাংশন
+#   পুরো চাঙ্কে একবার ডাকা হয় - lambda x: x % 2 == 0 একটি বুলিয়ান মাস্ক দেয়, তাই লুপ C তে চলে।
+#   অন্য সব চাঙ্ক (স্ট্রিং, int ও float মেশানো, বড় int) সাধারণ list থাকে, তাই মান কখনো বদলায় না।
+#   ফাংশনটি অ্যারেতে না চললে (যেকোনো এক্সেপশন বা ভুল আকারের ফল) প্রতিটি উপাদানে আলাদা ডাকা হয়।
+# - ndarray এ পাটিগণিত int64 এ হয়: map() এর ফল int64 সীমার কাছে গেলে (float64 এ একই ফাংশন চালিয়ে যাচাই)
+#   চাঙ্কটি পাইথন int এ আবার হিসাব হয়। filter() এর predicate এর ভেতরের হিসাব যাচাই হয় না - বড় সংখ্যায়
+#   backend="python" ব্যবহার করুন।
+# - NumPy না থাকলে (backend="python") চাঙ্ক হলো সাধারণ list: array('q') থেকে প্রতিটি উপাদান পড়তে নতুন int
+#   অবজেক্ট বানাতে হয়, তাই প্রতি ধাপে টাইপড অ্যারে ব্যবহার করলে লিস্টের চেয়ে প্রায় তিনগুণ ধীর হয়।
+#   টাইপড array('q')/array('d') শুধু শেষে to_array() তে তৈরি হয়।
+# - take(n) n টি উপাদান পেলেই সোর্স পড়া বন্ধ করে, তাই অসীম জেনারেটরেও চলে।
+# প্রতিটি ধাপ একটি নতুন Pipeline রিটার্ন করে, আগেরটি বদলায় না।
+from array import array
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_INT64_SAFE = 2.0 ** 62
+
+def _numeric_chunk(values):
+    # list -> ndarray শুধু তখনই যখন মানগুলো হুবহু থাকে; নাহলে list টিই ফেরত
+    kinds = set(map(type, values))
+    if kinds == {int}:
+        try:
+            return np.array(values, dtype=np.int64)
+        except OverflowError:
+            return values
+    if kinds == {float}:
+        return np.array(values, dtype=np.float64)
+    return values
+
+def _is_vector(chunk):
+    return np is not None and isinstance(chunk, np.ndarray)
+
+def _vector_result(result, chunk):
+    return isinstance(result, np.ndarray) and result.shape == chunk.shape and result.dtype.kind in 'biuf'
+
+class Pipeline:
+    def __init__(self, source, chunk_size=65536, backend=None, _stages=()):
+        if backend is None:
+            backend = "numpy" if np is not None else "python"
+        if backend == "numpy" and np is None:
+            raise ImportError("The numpy backend requires NumPy")
+        if backend not in ("numpy", "python"):
+            raise ValueError(f"Unknown backend: {backend}")
+        self.source = source
+        self.chunk_size = chunk_size
+        self.backend = backend
+        self._stages = _stages
+
+    def _then(self, stage):
+        return Pipeline(self.source, self.chunk_size, self.backend, self._stages + (stage,))
+
+    def filter(self, predicate):
+        return self._then(("filter", predicate))
+
+    def map(self, func):
+        return self._then(("map", func))
+
+    def even(self):
+        return self._then(("even", None))
+
+    def take(self, n):
+        return self._then(("take", n))
+
+    def _source_chunks(self):
+        size = self.chunk_size
+        source = self.source
+        numpy = self.backend == "numpy"
+        # NumPy তে সংখ্যার ndarray ও array থেকে কপি ছাড়া ভিউ নেওয়া হয়
+        if numpy and isinstance(source, (np.ndarray, array)):
+            data = np.asarray(source) if isinstance(source, np.ndarray) else np.frombuffer(source, dtype=source.typecode)
+            if data.ndim == 1 and data.dtype.kind in 'biuf':
+                for i in range(0, len(data), size):
+                    yield data[i:i + size]
+                return
+            source = data.tolist()
+        if isinstance(source, list):
+            for i in range(0, len(source), size):
+                batch = source[i:i + size]
+                yield _numeric_chunk(batch) if numpy else batch
+            return
+        it = iter(source)
+        while True:
+            batch = list(islice(it, size))
+            if not batch:
+                return
+            yield _numeric_chunk(batch) if numpy else batch
+
+    def _filter(self, chunk, predicate):
+        if _is_vector(chunk):
+            try:
+                mask = predicate(chunk)
+            except Exception:
+                mask = None
+            if not _vector_result(mask, chunk):
+                mask = np.fromiter(map(predicate, chunk.tolist()), dtype=bool, count=len(chunk))
+            # lambda x: x % 2 এর মতো predicate পূর্ণসংখ্যার অ্যারে দেয়; bool এ না বদলালে সেটি ইনডেক্স হিসেবে ব্যবহৃত হতো
+            return chunk[np.asarray(mask, dtype=bool)]
+        return list(filter(predicate, chunk))
+
+    def _map(self, chunk, func):
+        if _is_vector(chunk):
+            try:
+                result = func(chunk)
+            except Exception:
+                result = None
+            if _vector_result(result, chunk) and result.dtype.kind in 'iu':
+                # int64 মোড়ানো (wraparound) ধরতে একই ফাংশন float64 এ; যাচাই না করা গেলে int64 ফলটিই থাকে
+                try:
+                    approx = func(chunk.astype(np.float64))
+                    if _vector_result(approx, chunk) and len(approx) and np.nanmax(np.abs(approx)) >= _INT64_SAFE:
+                        result = None
+                except Exception:
+                    pass
+            if _vector_result(result, chunk):
+                return result
+            return _numeric_chunk(list(map(func, chunk.tolist())))
+        return list(map(func, chunk))
+
+    def _even(self, chunk):
+        if _is_vector(chunk):
+            return chunk[chunk % 2 == 0]
+        return [x for x in chunk if not x % 2]
+
+    def chunks(self):
+        # take() এর জন্য প্রতিটি ধাপের বাকি কোটা, (ধাপের অবস্থান -> বাকি সংখ্যা)
+        remaining = {i: n for i, (kind, n) in enumerate(self._stages) if kind == "take"}
+        for chunk in self._source_chunks():
+            for i, (kind, arg) in enumerate(self._stages):
+                if kind == "filter":
+                    chunk = self._filter(chunk, arg)
+                elif kind == "map":
+                    chunk = self._map(chunk, arg)
+                elif kind == "even":
+                    chunk = self._even(chunk)
+                else:
+                    chunk = chunk[:remaining[i]]
+                    remaining[i] -= len(chunk)
+                if not len(chunk):
+                    break
+            else:
+                yield chunk
+            if any(n <= 0 for n in remaining.values()):
+                return
+
+    def __iter__(self):
+        for chunk in self.chunks():
+            yield from (chunk if isinstance(chunk, list) else chunk.tolist())
+
+    def to_list(self):
+        result = []
+        for chunk in self.chunks():
+            result.extend(chunk if isinstance(chunk, list) else chunk.tolist())
+        return result
+
+    def to_array(self):
+        chunks = list(self.chunks())
+        if self.backend == "numpy":
+            return np.concatenate([np.asarray(chunk) for chunk in chunks]) if chunks else np.empty(0, dtype=np.int64)
+        # সব পূর্ণসংখ্যা হলে array('q'), কোনো float থাকলে array('d'); অন্য টাইপ থাকলে TypeError
+        result = array('q')
+        try:
+            for chunk in chunks:
+                result.extend(chunk)
+        except (TypeError, OverflowError):
+            result = array('d', [x for chunk in chunks for x in chunk])
+        return result
+
+def getEvenNumbersLazy(arr):
+    return Pipeline(arr).even().to_list()
+
+# print(getEvenNumbersLazy(arr))  # [2, 4, 6]
+# print(Pipeline(range(10**9)).even().map(lambda x: x * x).take(5).to_list())  # [0, 4, 16, 36, 64]
+
 
 # ৩. ডিকশনারি ব্যবহার (Dictionary Usage)
 # একটি ফাংশন লিখুন যা একটি বাক্য নিয়ে প্রতিটি শব্দের কতবার উপস্থিত হয়েছে তা গণনা করে একটি ডিকশনারি রিটার্ন করবে।
@@ -37,6 +219,114 @@ def word_count(sentence):
     return word_dict
 
 # print(word_count("I love Python because Python is fun"))
+
+# ৩.১ প্যারালাল ম্যাপ-রিডিউস ওয়ার্ড কাউন্ট (Parallel Map-Reduce Word Count)
+# লাখ লাখ ডকুমেন্ট বা ফাইলের জন্য: workers টি প্রসেস একটি কিউ থেকে ব্যাচ নিয়ে নিজের একটি Counter এ
+# গুনতে থাকে (map) - প্রতি ব্যাচে আলাদা Counter বানিয়ে প্যারেন্টে ফেরত পাঠানো হয় না।
+# ইনপুট শেষ হলে ওয়ার্কারগুলো নিজেরাই জোড়ায় জোড়ায় মার্জ করে (reduce) - ট্রি আকারে, log2(workers) ধাপে:
+# প্রথমে 1 -> 0, 3 -> 2 ..., তারপর 2 -> 0 ...। প্রতিটি আংশিক ফল মাত্র একবার পিকল হয়,
+# আর প্যারেন্ট শুধু ব্যাচ পাঠায় এবং ওয়ার্কার 0 থেকে চূড়ান্ত ফলটি নেয়। workers=1 হলে কোনো প্রসেস বা ব্যাচ নেই।
+
+import multiprocessing
+import os
+import queue
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress, islice
+
+def _batched(iterable, size):
+    it = iter(iterable)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+def _count_documents(documents, counts):
+    for doc in documents:
+        counts.update(doc.split())
+
+def _count_files(paths, counts):
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                counts.update(line.split())
+
+def _merge_counts(left, right):
+    # কোনো একটিতে এক্সেপশন থাকলে সেটিই সামনে যায়; নাহলে বড়টির মধ্যে ছোটটি যোগ করা সস্তা
+    if isinstance(left, BaseException) or isinstance(right, BaseException):
+        return left if isinstance(left, BaseException) else right
+    if len(left) < len(right):
+        left, right = right, left
+    left.update(right)
+    return left
+
+def _count_worker(count_fn, rank, workers, tasks, inboxes, results):
+    counts = Counter()
+    # ভুল হলেও কিউ খালি করা চালিয়ে যেতে হয়, নাহলে প্যারেন্ট ব্যাচ পাঠাতে গিয়ে আটকে যাবে
+    for batch in iter(tasks.get, None):
+        if not isinstance(counts, BaseException):
+            try:
+                count_fn(batch, counts)
+            except Exception as exc:
+                counts = exc
+    step = 1
+    while step < workers:
+        if rank % (2 * step):
+            inboxes[rank - step].put(counts)
+            return
+        if rank + step < workers:
+            counts = _merge_counts(counts, inboxes[rank].get())
+        step *= 2
+    results.put(counts)
+
+def _parallel_count(count_fn, items, workers, batch_size):
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        counts = Counter()
+        count_fn(items, counts)
+        return dict(counts)
+
+    # একসাথে 2 * workers এর বেশি ব্যাচ কিউতে থাকে না, তাই ইনপুট স্ট্রিম হিসেবে পড়া হয়
+    tasks = multiprocessing.Queue(maxsize=2 * workers)
+    inboxes = [multiprocessing.Queue() for _ in range(workers)]
+    results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=_count_worker, args=(count_fn, rank, workers, tasks, inboxes, results),
+                                         daemon=True)
+                 for rank in range(workers)]
+    for process in processes:
+        process.start()
+    finished = False
+    try:
+        for batch in _batched(items, batch_size):
+            tasks.put(batch)
+        for _ in processes:
+            tasks.put(None)
+        while True:
+            try:
+                counts = results.get(timeout=0.5)
+                break
+            except queue.Empty:
+                # কোনো ওয়ার্কার হঠাৎ মারা গেলে (যেমন মেমোরি শেষ) চিরকাল অপেক্ষা না করে এরর
+                if any(process.exitcode not in (None, 0) for process in processes):
+                    raise RuntimeError("A word count worker exited unexpectedly")
+        finished = True
+    finally:
+        for process in processes:
+            if not finished:
+                process.terminate()
+            process.join()
+    if isinstance(counts, BaseException):
+        raise counts
+    return dict(counts)
+
+def word_count_corpus(documents, workers=None, batch_size=1000):
+    return _parallel_count(_count_documents, documents, workers, batch_size)
+
+def word_count_files(paths, workers=None, batch_size=8):
+    return _parallel_count(_count_files, paths, workers, batch_size)
+
+# print(word_count_corpus(["I love Python", "Python is fun"]))  # {'I': 1, 'love': 1, 'Python': 2, 'is': 1, 'fun': 1}
 # ৪. ফাইল হ্যান্ডলিং (File Handling)
 # একটি ফাংশন লিখুন যা একটি টেক্সট ফাইল পড়বে এবং সেই ফাইলে কতটি লাইন, কতটি শব্দ এবং কতটি অক্ষর আছে তা গণনা করে রিটার্ন করবে।
 # উদাহরণ: "hello.txt" -> {"lines": 3, "words": 10, "characters": 50}
@@ -60,6 +350,80 @@ def file_stats(filename):
 
 # print(file_stats("hello.txt"))
 
+# ৪.১ বড় ফাইলের জন্য mmap ও চাঙ্ক-প্যারালাল মোড (Memory-mapped, Chunk-parallel Mode)
+# f.read() পুরো ফাইল মেমোরিতে আনে, আর splitlines()/split() আরও দুটি বড় লিস্ট বানায়।
+# এখানে ফাইলটি mmap করে নির্দিষ্ট সাইজের বাইট চাঙ্কে ভাগ করা হয়, প্রতিটি চাঙ্ক আলাদাভাবে গণনা হয়,
+# তারপর চাঙ্কের সীমানায় ভাঙা শব্দ জোড়া লাগানো হয়। মেমোরি ব্যবহার চাঙ্ক সাইজের সমান থাকে।
+# ফলাফল file_stats() এর মতোই: টেক্সট মোডে \r\n ও \r একটি \n হিসেবে গণ্য হয়।
+
+import mmap
+
+# str.splitlines() যেসব অক্ষরে লাইন ভাঙে (\r ও \r\n আলাদাভাবে গণনা করা হয়)
+LINE_BREAKS = ('\n', '\x0b', '\x0c', '\x1c', '\x1d', '\x1e', '\x85', '\u2028', '\u2029')
+
+def _chunk_bounds(mm, size, chunk_size):
+    # সীমানা UTF-8 কন্টিনিউয়েশন বাইট (10xxxxxx) বা \r\n এর মাঝখানে পড়লে একটু সামনে সরানো হয়
+    bounds = [0]
+    pos = chunk_size
+    while pos < size:
+        while pos < size and mm[pos] & 0xC0 == 0x80:
+            pos += 1
+        if pos < size and mm[pos - 1] == 0x0D and mm[pos] == 0x0A:
+            pos += 1
+        if pos >= size:
+            break
+        bounds.append(pos)
+        pos += chunk_size
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+def _chunk_stats(job):
+    filename, start, end = job
+    with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = mm[start:end].decode('utf-8')
+    crlf = text.count('\r\n')
+    breaks = text.count('\r') - crlf + sum(text.count(ch) for ch in LINE_BREAKS)
+    return {
+        "breaks": breaks,
+        "words": len(text.split()),
+        "characters": len(text) - crlf,
+        "starts_in_word": not text[0].isspace(),
+        "ends_in_word": not text[-1].isspace(),
+        "ends_with_break": text[-1] == '\r' or text[-1] in LINE_BREAKS,
+    }
+
+def file_stats_mmap(filename, chunk_size=16 * 1024 * 1024, workers=1):
+    size = os.path.getsize(filename)
+    if size == 0:
+        return {"lines": 0, "words": 0, "characters": 0}
+
+    with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        jobs = [(filename, start, end) for start, end in _chunk_bounds(mm, size, chunk_size)]
+
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = pool.map(_chunk_stats, jobs)
+            return _merge_chunk_stats(parts)
+    return _merge_chunk_stats(map(_chunk_stats, jobs))
+
+def _merge_chunk_stats(parts):
+    lines = words = characters = 0
+    prev = None
+    for part in parts:
+        lines += part["breaks"]
+        words += part["words"]
+        characters += part["characters"]
+        # আগের চাঙ্ক শব্দের মাঝে শেষ হলে এবং এই চাঙ্ক শব্দ দিয়ে শুরু হলে একই শব্দ দুবার গোনা হয়েছে
+        if prev and prev["ends_in_word"] and part["starts_in_word"]:
+            words -= 1
+        prev = part
+    # শেষ লাইনটি লাইন-ব্রেক ছাড়া শেষ হলে সেটিও একটি লাইন
+    if not prev["ends_with_break"]:
+        lines += 1
+    return {"lines": lines, "words": words, "characters": characters}
+
+# print(file_stats_mmap("big.log", workers=os.cpu_count()))
+
 
 # ৫. এক্সেপশন হ্যান্ডলিং (Exception Handling)
 # একটি ফাংশন লিখুন যা দুটি সংখ্যা নিয়ে ভাগ করবে, কিন্তু শূন্য দিয়ে ভাগ করার সময় একটি উপযুক্ত এরর মেসেজ দেখাবে।
@@ -105,6 +469,244 @@ class BankAccount:
 # print(account.balance)  # 500
 
 
+# ৬.১ হাই-থ্রুপুট ট্রানজ্যাকশন লেজার (High-throughput Transaction Ledger)
+# BankAccount এ ব্যালেন্স একটি float, কোনো লক নেই, তাই একাধিক থ্রেড একসাথে deposit/withdraw করলে
+# আপডেট হারিয়ে যায়, আর প্রসেস বন্ধ হলে সব হারায়। Ledger অনেক অ্যাকাউন্ট একসাথে রাখে:
+# - ব্যালেন্স পূর্ণসংখ্যা সেন্টে (float এর রাউন্ডিং সমস্যা নেই)
+# - apply(transactions) একসাথে অনেক ট্রানজ্যাকশন নেয়; প্রতিটি শুধু নিজের অ্যাকাউন্টের লক ধরে
+#   (অ্যাকাউন্টগুলো lock_stripes টি লকে ভাগ করা), ট্রান্সফারে দুটি লক সবসময় একই ক্রমে ধরা হয়
+# - প্রতিটি সফল পরিবর্তন append-only জার্নালে যায়; অনেক থ্রেডের লেখা একসাথে একটি fsync এ
+#   ডিস্কে যায় (group commit)
+# - snapshot_every টি ট্রানজ্যাকশন পরপর পুরো অবস্থা স্ন্যাপশটে লেখা হয় এবং নতুন জার্নাল শুরু হয়,
+#   তাই রিকভারিতে শুধু স্ন্যাপশট + শেষ জার্নালটুকু পড়তে হয়
+# জার্নালে পরিবর্তন (delta) লেখা হয়, যোগ করার ক্রম বদলালেও ফল একই, তাই থ্রেডগুলোর লেখার ক্রম গুরুত্বপূর্ণ নয়।
+
+import json
+import threading
+
+def _is_cents(value):
+    # শুধু পূর্ণসংখ্যা সেন্ট: float জার্নালে গেলে রিকভারির int() ব্যর্থ হয়; bool ও int এর সাবক্লাস, তাই সেটিও বাদ
+    return isinstance(value, int) and not isinstance(value, bool)
+
+class Ledger:
+    def __init__(self, directory=None, snapshot_every=100000, lock_stripes=256):
+        self.directory = directory
+        self.snapshot_every = snapshot_every
+        self._balances = {}                # অ্যাকাউন্ট নম্বর -> ব্যালেন্স (সেন্ট)
+        self._holders = {}                 # অ্যাকাউন্ট নম্বর -> হোল্ডারের নাম
+        self._locks = [threading.Lock() for _ in range(lock_stripes)]
+        self._journal_lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._snapshot_lock = threading.Lock()
+        self._pending = []                 # এখনো ডিস্কে না যাওয়া জার্নাল লাইন
+        self._appended = 0                 # মোট কতগুলো লাইন জমা হয়েছে
+        self._synced = 0                   # কতগুলো লাইন পর্যন্ত fsync হয়েছে
+        self._since_snapshot = 0
+        self._generation = 0
+        self._journal = None
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self._recover()
+            self._journal = open(self._journal_path(self._generation), 'a', encoding='utf-8')
+
+    def _journal_path(self, generation):
+        return os.path.join(self.directory, f"journal.{generation}.log")
+
+    def _snapshot_path(self):
+        return os.path.join(self.directory, "snapshot.json")
+
+    def _stripe(self, account_number):
+        return hash(account_number) % len(self._locks)
+
+    def _lock_for(self, account_number):
+        return self._locks[self._stripe(account_number)]
+
+    def _append(self, line):
+        with self._journal_lock:
+            self._pending.append(line)
+            self._appended += 1
+            return self._appended
+
+    def _commit(self, seq):
+        # গ্রুপ কমিট: যে থ্রেড আগে sync লক পায় সে সবার জমানো লাইন একসাথে লিখে একবার fsync করে
+        if self._journal is None:
+            return
+        with self._sync_lock:
+            if self._synced >= seq:
+                return
+            self._flush_pending()
+
+    def _flush_pending(self):
+        with self._journal_lock:
+            lines, self._pending = self._pending, []
+            last = self._appended
+        if lines:
+            self._journal.write(''.join(lines))
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+        self._synced = last
+
+    def open_account(self, account_number, holder_name, balance_cents=0):
+        account_number = str(account_number)
+        if '\t' in account_number or '\n' in account_number:
+            raise ValueError("Account number must not contain tabs or newlines")
+        if not _is_cents(balance_cents):
+            raise TypeError("balance_cents must be an int")
+        with self._lock_for(account_number):
+            if account_number in self._balances:
+                raise ValueError(f"Account {account_number} already exists")
+            self._balances[account_number] = balance_cents
+            self._holders[account_number] = holder_name
+            seq = self._append(f"o\t{json.dumps([account_number, holder_name, balance_cents])}\n")
+        self._commit(seq)
+
+    def balance(self, account_number):
+        return self._balances[str(account_number)]
+
+    def _apply_one(self, transaction):
+        kind = transaction[0]
+        if kind == 'transfer':
+            _, source, target, amount = transaction
+            source, target = str(source), str(target)
+            if not _is_cents(amount) or amount <= 0 or source == target or source not in self._balances or target not in self._balances:
+                return False, 0
+            # স্ন্যাপশটের মতো একই (ইনডেক্স) ক্রমে লক ধরা হয়, তাই ডেডলক হয় না
+            locks = [self._locks[i] for i in sorted({self._stripe(source), self._stripe(target)})]
+            for lock in locks:
+                lock.acquire()
+            try:
+                if self._balances[source] < amount:
+                    return False, 0
+                self._balances[source] -= amount
+                self._balances[target] += amount
+                return True, self._append(f"t\t{source}\t{target}\t{amount}\n")
+            finally:
+                for lock in locks:
+                    lock.release()
+
+        _, account, amount = transaction
+        account = str(account)
+        if not _is_cents(amount) or amount <= 0 or account not in self._balances or kind not in ('deposit', 'withdraw'):
+            return False, 0
+        delta = amount if kind == 'deposit' else -amount
+        with self._lock_for(account):
+            if self._balances[account] + delta < 0:
+                return False, 0
+            self._balances[account] += delta
+            return True, self._append(f"d\t{account}\t{delta}\n")
+
+    def apply(self, transactions):
+        # প্রতিটি ট্রানজ্যাকশন: ('deposit', acc, cents), ('withdraw', acc, cents), ('transfer', from, to, cents)
+        # ফলাফল: প্রতিটির জন্য True (হয়েছে) বা False (বাতিল, যেমন পর্যাপ্ত ব্যালেন্স নেই)
+        results = []
+        last_seq = 0
+        for transaction in transactions:
+            ok, seq = self._apply_one(transaction)
+            results.append(ok)
+            last_seq = max(last_seq, seq)
+        # পুরো ব্যাচের জন্য একবার কমিট
+        self._commit(last_seq)
+        self._since_snapshot += len(results)
+        if self.directory and self._since_snapshot >= self.snapshot_every:
+            self.snapshot()
+        return results
+
+    def deposit(self, account_number, amount_cents):
+        if not self.apply([('deposit', account_number, amount_cents)])[0]:
+            raise ValueError("Invalid deposit")
+
+    def withdraw(self, account_number, amount_cents):
+        if not self.apply([('withdraw', account_number, amount_cents)])[0]:
+            raise ValueError("Insufficient balance")
+        return amount_cents
+
+    def snapshot(self):
+        if not self.directory:
+            return
+        # অন্য থ্রেড স্ন্যাপশট নিচ্ছে হলে আবার নেওয়ার দরকার নেই
+        if not self._snapshot_lock.acquire(blocking=False):
+            return
+        try:
+            # সব লক ধরে রাখলে কোনো ট্রানজ্যাকশন মাঝপথে থাকে না, অবস্থাটি সামঞ্জস্যপূর্ণ
+            for lock in self._locks:
+                lock.acquire()
+            try:
+                with self._sync_lock:
+                    self._flush_pending()
+                    generation = self._generation + 1
+                    state = {
+                        "generation": generation,
+                        "accounts": {acc: [self._holders[acc], bal] for acc, bal in self._balances.items()},
+                    }
+                    tmp_path = self._snapshot_path() + '.tmp'
+                    with open(tmp_path, 'w', encoding='utf-8') as f:
+                        json.dump(state, f)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(tmp_path, self._snapshot_path())
+                    # স্ন্যাপশটে সব আছে, তাই নতুন জার্নাল শুরু করে পুরনোটি মুছে ফেলা যায়
+                    self._journal.close()
+                    self._journal = open(self._journal_path(generation), 'a', encoding='utf-8')
+                    os.remove(self._journal_path(self._generation))
+                    self._generation = generation
+                    self._since_snapshot = 0
+            finally:
+                for lock in self._locks:
+                    lock.release()
+        finally:
+            self._snapshot_lock.release()
+
+    def _recover(self):
+        if os.path.exists(self._snapshot_path()):
+            with open(self._snapshot_path(), 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            self._generation = state["generation"]
+            for account, (holder, balance) in state["accounts"].items():
+                self._holders[account] = holder
+                self._balances[account] = balance
+
+        path = self._journal_path(self._generation)
+        if not os.path.exists(path):
+            return
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.endswith('\n'):
+                    break   # ক্র্যাশের সময় অর্ধেক লেখা শেষ লাইন বাদ
+                kind, *fields = line[:-1].split('\t', 1 if line[0] == 'o' else 3)
+                if kind == 'o':
+                    account, holder, balance = json.loads(fields[0])
+                    self._holders[account] = holder
+                    self._balances[account] = balance
+                elif kind == 'd':
+                    self._balances[fields[0]] += int(fields[1])
+                elif kind == 't':
+                    amount = int(fields[2])
+                    self._balances[fields[0]] -= amount
+                    self._balances[fields[1]] += amount
+
+    def close(self):
+        if self._journal:
+            with self._sync_lock:
+                self._flush_pending()
+            self._journal.close()
+            self._journal = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+# টেস্ট কেস
+# with Ledger("ledger_data") as ledger:
+#     ledger.open_account("123456", "Rahim")
+#     ledger.open_account("654321", "Karim")
+#     print(ledger.apply([('deposit', "123456", 100000), ('withdraw', "123456", 50000),
+#                         ('transfer', "123456", "654321", 20000), ('withdraw', "654321", 999999)]))
+#     # [True, True, True, False]
+#     print(ledger.balance("123456"))  # 30000 সেন্ট = 300.00
+
+
 # ৭. ইনহেরিটেন্স (Inheritance)
 # "Vehicle" নামে একটি বেস ক্লাস তৈরি করুন এবং "Car" ও "Motorcycle" নামে দুটি সাবক্লাস তৈরি করুন।
 # Vehicle ক্লাসে make, model, year প্রোপার্টি এবং একটি display_info() মেথড থাকবে।
@@ -142,21 +744,218 @@ class Motorcycle(Vehicle):
 # bike = Motorcycle("Honda", "CBR500R", 2021, 500)
 # print(bike.display_info())  # 2021 Honda CBR500R (500cc)
 
+# ৭.১ কলামভিত্তিক রেকর্ড স্টোর (Columnar Record Store)
+# কোটি কোটি Vehicle/Car/Motorcycle (বা index.py এর Person/Student) অবজেক্টের প্রতিটির আলাদা __dict__ থাকে,
+# তাই প্রতি রেকর্ডে কয়েকশো বাইট লাগে। ColumnStore প্রতিটি ফিল্ড আলাদা টাইপড array তে রাখে:
+# - সংখ্যার ফিল্ড: array টাইপকোড ('h' = ২ বাইট, 'b' = ১ বাইট ...)
+# - স্ট্রিং ফিল্ড (str): একটি শেয়ার্ড StringTable এ একবার রাখা হয়, কলামে শুধু ৪ বাইটের আইডি
+#   তাই Car এর একটি রেকর্ড (make, model, year, doors) মাত্র ১১ বাইট
+# - store[i] একটি হালকা __slots__ রো-ভিউ দেয়, যা ডেটা কপি না করে কলাম থেকে পড়ে
+# - where() পুরো কলামে একবারে তুলনা করে (NumPy থাকলে ভেক্টরাইজড); স্ট্রিং ফিল্ডে প্রতিটি আলাদা স্ট্রিং একবারই তুলনা হয়
+# - render() একটি টেমপ্লেট দিয়ে সব রো এর display_info একসাথে বানায়
+import operator
+from itertools import compress, repeat
+from string import Formatter
+
+class StringTable:
+    def __init__(self):
+        self.strings = []
+        self._ids = {}
+
+    def intern(self, value):
+        index = self._ids.get(value)
+        if index is None:
+            index = self._ids[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+    def lookup(self, value):
+        return self._ids.get(value)
+
+    def __len__(self):
+        return len(self.strings)
+
+_COMPARISONS = {
+    "==": operator.eq, "!=": operator.ne,
+    "<": operator.lt, "<=": operator.le,
+    ">": operator.gt, ">=": operator.ge,
+}
+
+class RowView:
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store, index):
+        self._store = store
+        self._index = index
+
+    def display_info(self):
+        return self._store.render(rows=(self._index,))[0]
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={value!r}" for name, value in zip(self._store.fields, self._store.row(self._index)))
+        return f"{type(self).__name__}({values})"
+
+def _column_property(name, is_string):
+    if is_string:
+        def get(view):
+            store = view._store
+            return store.strings.strings[store.columns[name][view._index]]
+    else:
+        def get(view):
+            return view._store.columns[name][view._index]
+    return property(get)
+
+class ColumnStore:
+    def __init__(self, schema, template=None, name="Row"):
+        # schema: {ফিল্ড: array টাইপকোড বা str}, যেমন {"make": str, "year": 'h'}
+        self.fields = tuple(schema)
+        self.string_fields = frozenset(f for f, kind in schema.items() if kind is str)
+        self.columns = {f: array('I' if kind is str else kind) for f, kind in schema.items()}
+        self.strings = StringTable()
+        self.template = template
+        self._templates = {}
+        # প্রতিটি ফিল্ডের জন্য property সহ একটি ভিউ ক্লাস; __slots__ = () তাই ভিউতে কোনো __dict__ নেই
+        attrs = {f: _column_property(f, f in self.string_fields) for f in self.fields}
+        self._view = type(name, (RowView,), {"__slots__": (), **attrs})
+
+    def __len__(self):
+        return len(self.columns[self.fields[0]])
+
+    def append(self, *values, **named):
+        self.extend([values or tuple(named[f] for f in self.fields)])
+
+    def extend(self, rows):
+        # rows: টাপলের ইটারেবল; কলাম ধরে ধরে যোগ হয় যাতে array.extend() C তে চলে।
+        # আগে সব কলাম আলাদা array তে বানানো হয়, তাই কোনো মান ভুল হলে (OverflowError) কলামগুলো অসমান হয় না
+        batch = list(rows)
+        for row in batch:
+            if len(row) != len(self.fields):
+                raise ValueError(f"Expected {len(self.fields)} values, got {len(row)}")
+        staged = []
+        for position, f in enumerate(self.fields):
+            values = map(operator.itemgetter(position), batch)
+            if f in self.string_fields:
+                values = map(self.strings.intern, values)
+            staged.append(array(self.columns[f].typecode, values))
+        for f, values in zip(self.fields, staged):
+            self.columns[f].extend(values)
+
+    def extend_objects(self, objects):
+        objects = list(objects)
+        self.extend(zip(*[map(operator.attrgetter(f), objects) for f in self.fields]))
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ColumnStore index out of range")
+        return self._view(self, index)
+
+    def __iter__(self):
+        view = self._view
+        for index in range(len(self)):
+            yield view(self, index)
+
+    def row(self, index):
+        strings = self.strings.strings
+        return tuple(strings[self.columns[f][index]] if f in self.string_fields else self.columns[f][index]
+                     for f in self.fields)
+
+    def column(self, name):
+        if name in self.string_fields:
+            return list(map(self.strings.strings.__getitem__, self.columns[name]))
+        return self.columns[name]
+
+    def where(self, name, op, value, rows=None):
+        # যেসব রো তে শর্ত সত্য তাদের ইনডেক্স (array('q')); rows দিলে শুধু সেগুলোর মধ্যে খোঁজা হয়, তাই চেইন করা যায়
+        compare = _COMPARISONS[op]
+        column = self.columns[name]
+        if name in self.string_fields:
+            # প্রতিটি আলাদা স্ট্রিং একবার তুলনা করে আইডি -> True/False টেবিল, তারপর কলাম থেকে সংগ্রহ
+            truth = bytes(map(compare, self.strings.strings, repeat(value)))
+            if np is not None:
+                codes = np.frombuffer(column, dtype=np.uint32)
+                selected = codes if rows is None else codes[np.asarray(rows, dtype=np.int64)]
+                mask = np.frombuffer(truth, dtype=np.bool_)[selected] if truth else np.zeros(len(selected), dtype=bool)
+            else:
+                hit = truth.__getitem__
+                if rows is None:
+                    return array('q', compress(range(len(column)), map(hit, column)))
+                return array('q', [i for i in rows if truth[column[i]]])
+        elif np is not None:
+            data = np.frombuffer(column, dtype=column.typecode)
+            mask = compare(data if rows is None else data[np.asarray(rows, dtype=np.int64)], value)
+        else:
+            if rows is None:
+                return array('q', compress(range(len(column)), map(compare, column, repeat(value))))
+            return array('q', [i for i in rows if compare(column[i], value)])
+        indices = np.flatnonzero(mask) if rows is None else np.asarray(rows, dtype=np.int64)[mask]
+        return array('q', indices.astype(np.int64).tobytes()) if len(indices) else array('q')
+
+    def _positional_template(self, template):
+        # "{year} {make}" -> "{2} {0}", যাতে map(template.format, *কলাম) দিয়ে এক পাসে রেন্ডার হয়
+        if template in self._templates:
+            return self._templates[template]
+        parts = []
+        for literal, field, spec, conversion in Formatter().parse(template):
+            parts.append(literal.replace("{", "{{").replace("}", "}}"))
+            if field is not None:
+                parts.append("{" + str(self.fields.index(field)))
+                if conversion:
+                    parts.append("!" + conversion)
+                if spec:
+                    parts.append(":" + spec)
+                parts.append("}")
+        result = self._templates[template] = "".join(parts)
+        return result
+
+    def render(self, template=None, rows=None):
+        template = self._positional_template(template or self.template)
+        strings = self.strings.strings.__getitem__
+        columns = []
+        for f in self.fields:
+            column = self.columns[f]
+            if rows is not None:
+                column = map(column.__getitem__, rows)
+            columns.append(map(strings, column) if f in self.string_fields else column)
+        return list(map(template.format, *columns))
+
+    def nbytes(self):
+        return sum(column.itemsize * len(column) for column in self.columns.values())
+
+VEHICLE_INFO = "{year} {make} {model}"
+
+def car_store():
+    return ColumnStore({"make": str, "model": str, "year": 'h', "doors": 'b'},
+                       VEHICLE_INFO + " with {doors} doors", name="CarRow")
+
+def motorcycle_store():
+    return ColumnStore({"make": str, "model": str, "year": 'h', "engine_size": 'H'},
+                       VEHICLE_INFO + " ({engine_size}cc)", name="MotorcycleRow")
+
+# টেস্ট কেস
+# cars = car_store()
+# cars.append("Toyota", "Corolla", 2020, 4)
+# cars.extend_objects([Car("Honda", "Civic", 2018, 2)])
+# print(cars[0].display_info())                    # 2020 Toyota Corolla with 4 doors
+# recent = cars.where("year", ">=", 2019)
+# print(cars.render(rows=cars.where("make", "==", "Toyota", rows=recent)))  # ['2020 Toyota Corolla with 4 doors']
+# index.py এর Person/Student এর জন্যও একইভাবে:
+# students = ColumnStore({"name": str, "age": 'B', "grade": str}, "I am {name}, {age} years old", name="StudentRow")
+
 
 # ৮. ডেকোরেটর (Decorators)
 # একটি টাইমিং ডেকোরেটর তৈরি করুন যা কোন ফাংশন কতক্ষণ সময় নিয়ে এক্সিকিউট হয় তা মাপবে এবং প্রিন্ট করবে।
 # এই ডেকোরেটর ব্যবহার করে fibonacci সিরিজ জেনারেট করার একটি ফাংশন লিখুন।
 # JavaScript এ এটি করতে হলে: const timerDecorator = (fn) => { ... };
 
+# প্রতি কলে print না করে latency.py এর হিস্টোগ্রামে perf_counter_ns() দিয়ে রেকর্ড হয়।
+# জেনারেটর fibonacci এর ক্ষেত্রে শুধু জেনারেটর তৈরি নয়, পুরো ইটারেশনের সময় মাপা হয়।
 import time
+from latency import instrument
 
 def timer_decorator(func):
-    def wrapper(*args, **kwargs):
-        start = time.time()
-        result = func(*args, **kwargs)
-        print(f"Execution time: {time.time() - start:.4f} seconds")
-        return result
-    return wrapper
+    return instrument(func)
 
 @timer_decorator
 def fibonacci(n):
@@ -167,6 +966,8 @@ def fibonacci(n):
 
 # টেস্ট কেস
 # list(fibonacci(10))  # [0, 1, 1, 2, 3, 5, 8, 13, 21, 34]
+# from latency import snapshot
+# print(snapshot()["__main__.fibonacci"]["p99_ns"])
 
 
 # ৯. জেনারেটর (Generators)
@@ -175,25 +976,143 @@ def fibonacci(n):
 # উদাহরণ: list(generate_primes(5)) -> [2, 3, 5, 7, 11]
 # JavaScript এ এটি করতে হলে: function* generatePrimes(count) { ... }
 
-def generate_primes(count):
-    def is_prime(n):
+# ট্রায়াল ডিভিশন প্রতিটি সংখ্যার জন্য √n পর্যন্ত ভাগ করে, মোট প্রায় O(n√n)।
+# তার বদলে এখানে সেগমেন্টেড সিভ অফ এরাটোস্থেনিস (Segmented Sieve of Eratosthenes) ব্যবহার করা হয়েছে:
+# - শুধু বিজোড় সংখ্যা রাখা হয় (২ আলাদাভাবে), প্রতিটি সেগমেন্টে segment_size টি বিজোড় সংখ্যা
+# - কাটাকাটি হয় বাইট-প্রতি-সংখ্যা bytearray তে স্লাইস অ্যাসাইনমেন্ট দিয়ে (C গতিতে),
+#   তারপর সেগমেন্টটি বিট-প্যাক করে (প্রতি বাইটে ৮টি বিজোড় সংখ্যা) মেমোরিতে রাখা হয়
+# - cache_dir দিলে প্যাক করা সেগমেন্ট ডিস্কে সেভ হয়, পরের রানে সেখান থেকে পড়া হয়
+
+import math
+
+_TO_ASCII = bytes.maketrans(b'\x00\x01', b'01')
+_FROM_ASCII = bytes.maketrans(b'01', b'\x00\x01')
+
+def _pack_bits(flags):
+    # flags[i] -> i নম্বর বিট; বেস-২ int রূপান্তর CPython এ লিনিয়ার সময়ে হয়
+    bits = bytes(flags[::-1]).translate(_TO_ASCII)
+    return int(bits, 2).to_bytes((len(flags) + 7) // 8, 'little')
+
+def _unpack_bits(packed, size):
+    bits = format(int.from_bytes(packed, 'little'), f'0{size}b')
+    return bytearray(bits[::-1].encode()).translate(_FROM_ASCII)
+
+class PrimeSieve:
+    def __init__(self, segment_size=1 << 18, cache_dir=None):
+        self.segment_size = segment_size   # প্রতি সেগমেন্টে কতগুলো বিজোড় সংখ্যা
+        self.cache_dir = cache_dir
+        self._segments = {}                # সেগমেন্ট নম্বর -> বিট-প্যাক করা bytes
+        self._base_primes = []             # কাটার জন্য বিজোড় প্রাইম, √(সর্বোচ্চ সংখ্যা) পর্যন্ত
+        self._base_limit = 1
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _segment_path(self, k):
+        return os.path.join(self.cache_dir, f"primes_{self.segment_size}_{k}.bin")
+
+    def _ensure_base_primes(self, limit):
+        if limit <= self._base_limit:
+            return
+        limit = max(limit, 2 * self._base_limit)
+        flags = bytearray([1]) * (limit // 2 + 1)   # flags[i] -> 2i+1
+        flags[0] = 0
+        for i in range(1, (math.isqrt(limit) - 1) // 2 + 1):
+            if flags[i]:
+                p = 2 * i + 1
+                start = p * p // 2
+                flags[start::p] = bytes(len(range(start, len(flags), p)))
+        self._base_primes = [2 * i + 1 for i in range(1, len(flags)) if flags[i]]
+        self._base_limit = limit
+
+    def _sieve_segment(self, k):
+        size = self.segment_size
+        lo = 2 * size * k                  # flags[i] -> lo + 2i + 1
+        hi = lo + 2 * size
+        self._ensure_base_primes(math.isqrt(hi) + 1)
+        flags = bytearray([1]) * size
+        if k == 0:
+            flags[0] = 0                   # 1 প্রাইম নয়
+        for p in self._base_primes:
+            if p * p >= hi:
+                break
+            m = max(p * p, (lo + p - 1) // p * p)
+            if m % 2 == 0:
+                m += p
+            start = (m - lo - 1) // 2
+            flags[start::p] = bytes(len(range(start, size, p)))
+        return flags
+
+    def _packed_segment(self, k):
+        packed = self._segments.get(k)
+        if packed is not None:
+            return packed
+        path = self._segment_path(k) if self.cache_dir else None
+        if path and os.path.exists(path):
+            with open(path, 'rb') as f:
+                packed = f.read()
+        else:
+            packed = _pack_bits(self._sieve_segment(k))
+            if path:
+                # আংশিক লেখা ফাইল যেন পরের রানে না পড়া হয়, তাই আগে অস্থায়ী নামে লিখে রিনেম
+                with open(path + '.tmp', 'wb') as f:
+                    f.write(packed)
+                os.replace(path + '.tmp', path)
+        self._segments[k] = packed
+        return packed
+
+    def _segment_primes(self, k, lo=0, hi=None):
+        # সেগমেন্ট k এর [lo, hi) এর মধ্যের প্রাইমগুলো, ছোট থেকে বড়
+        size = self.segment_size
+        base = 2 * size * k
+        flags = _unpack_bits(self._packed_segment(k), size)
+        first = max(0, (lo - base) // 2)
+        last = size if hi is None else min(size, max(0, (hi - base) // 2))
+        numbers = range(base + 2 * first + 1, base + 2 * last + 1, 2)
+        return list(compress(numbers, flags[first:last]))
+
+    def primes(self, start=2):
+        # অসীম লেজি জেনারেটর: start বা তার বড় সব প্রাইম
+        if start <= 2:
+            yield 2
+        k = max(start, 0) // (2 * self.segment_size)
+        while True:
+            yield from self._segment_primes(k, lo=start)
+            k += 1
+
+    def primes_in_range(self, lo, hi):
+        # range() এর মতো: lo সহ, hi বাদে
+        result = [2] if lo <= 2 < hi else []
+        if hi <= 3:
+            return result
+        span = 2 * self.segment_size
+        for k in range(max(lo, 0) // span, (hi - 1) // span + 1):
+            result.extend(self._segment_primes(k, lo, hi))
+        return result
+
+    def prime_count(self, n):
+        # n বা তার ছোট প্রাইমের সংখ্যা; পূর্ণ সেগমেন্টের জন্য শুধু বিট গোনা হয়
         if n < 2:
-            return False
-        for i in range(2, int(n**0.5)+1):
-            if n % i == 0:
-                return False
-        return True
-    
-    num = 2
-    found = 0
-    while found < count:
-        if is_prime(num):
-            yield num
-            found += 1
-        num += 1
+            return 0
+        span = 2 * self.segment_size
+        full = (n + 1) // span
+        total = 1 + sum(int.from_bytes(self._packed_segment(k), 'little').bit_count() for k in range(full))
+        return total + len(self._segment_primes(full, full * span, n + 1))
+
+_PRIME_SIEVE = PrimeSieve()
+
+def generate_primes(count):
+    yield from islice(_PRIME_SIEVE.primes(), max(count, 0))
+
+def primes_in_range(lo, hi):
+    return _PRIME_SIEVE.primes_in_range(lo, hi)
+
+def prime_count(n):
+    return _PRIME_SIEVE.prime_count(n)
 
 # টেস্ট কেস
 # print(list(generate_primes(5)))  # [2, 3, 5, 7, 11]
+# print(primes_in_range(10, 30))    # [11, 13, 17, 19, 23, 29]
+# print(prime_count(1000000))       # 78498
 
 
 # ১০. API ইন্টিগ্রেশন (API Integration)
@@ -209,13 +1128,159 @@ def fetch_api_data(url):
     try:
         response = requests.get(url)
         response.raise_for_status()
-        return [{
-            'id': item['id'],
-            'title': item['title'][:50], 
-            'body': item['body']
-        } for item in response.json()]
+        return _format_posts(response.json())
     except requests.exceptions.RequestException as e:
         return {"error": f"API request failed: {str(e)}"}
 
+def _format_posts(items):
+    return [{
+        'id': item['id'],
+        'title': item['title'][:50], 
+        'body': item['body']
+    } for item in items]
+
 # টেস্ট কেস
 # print(fetch_api_data('https://jsonplaceholder.typicode.com/posts'))
+
+# ১০.১ কনকারেন্ট ব্যাচ ফেচার (Concurrent, Connection-pooled Batch Fetcher)
+# হাজার হাজার URL এর জন্য প্রতিবার requests.get() করলে প্রতিটি কলে নতুন TCP/TLS কানেকশন হয়
+# এবং একটার পর একটা অপেক্ষা করতে হয়। BatchFetcher একটি Session এর কানেকশন পুল (keep-alive) শেয়ার করে,
+# concurrency সীমার মধ্যে একসাথে অনেক রিকোয়েস্ট পাঠায়, ব্যর্থ হলে ব্যাকঅফ দিয়ে আবার চেষ্টা করে,
+# এবং সফল রেসপন্স cache_ttl সেকেন্ড পর্যন্ত মেমোরিতে ক্যাশ রাখে। ক্যাশে সর্বোচ্চ cache_size টি URL থাকে (LRU),
+# মেয়াদোত্তীর্ণ এন্ট্রি পড়ার সময়ই মুছে ফেলা হয়, তাই আলাদা আলাদা URL এ ক্যাশ সীমাহীন বাড়ে না।
+# fetch_api_data_batch() একই অপশনের জন্য একটি BatchFetcher মডিউল লেভেলে রেখে দেয়, তাই ক্যাশ ও
+# keep-alive কানেকশন এক কল থেকে পরের কলে টিকে থাকে।
+# ফলাফলের ফরম্যাট fetch_api_data() এর মতোই, প্রতিটি URL এর জন্য একটি করে, একই ক্রমে।
+
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# ক্যাশের ফলাফল বা একই URL এর ফলাফল সরাসরি ফেরত দিলে কলার একটি লিস্ট বদলালে ক্যাশ ও অন্য কলারের ডেটাও বদলে যায়,
+# তাই প্রতিবার আলাদা কপি দেওয়া হয় (পোস্টের মানগুলো স্ট্রিং/সংখ্যা, তাই ডিক-প্রতি শ্যালো কপিই যথেষ্ট)
+def _copy_result(result):
+    if isinstance(result, list):
+        return [dict(post) for post in result]
+    return dict(result)
+
+class BatchFetcher:
+    def __init__(self, concurrency=32, timeout=10, retries=3, backoff=0.2, cache_ttl=60, cache_size=1024):
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self._cache = OrderedDict()   # url -> (মেয়াদ শেষের সময়, ফলাফল), পুরনো ব্যবহার আগে
+        self._lock = threading.Lock()
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET']),
+        )
+        adapter = HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def fetch(self, url):
+        now = time.monotonic()
+        with self._lock:
+            cached = self._cache.get(url)
+            if cached is not None:
+                if cached[0] > now:
+                    self._cache.move_to_end(url)
+                    return _copy_result(cached[1])
+                del self._cache[url]
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            result = _format_posts(response.json())
+        except requests.exceptions.RequestException as e:
+            # এরর ক্যাশ করা হয় না, পরের বার আবার চেষ্টা হবে
+            return {"error": f"API request failed: {str(e)}"}
+        with self._lock:
+            self._cache[url] = (now + self.cache_ttl, _copy_result(result))
+            self._cache.move_to_end(url)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def fetch_many(self, urls):
+        urls = list(urls)
+        unique = list(dict.fromkeys(urls))   # একই URL একবারই ফেচ হবে
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            results = dict(zip(unique, pool.map(self.fetch, unique)))
+        out = []
+        seen = set()
+        for url in urls:
+            result = results[url]
+            out.append(_copy_result(result) if url in seen else result)
+            seen.add(url)
+        return out
+
+    async def fetch_many_async(self, urls):
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch_one(url):
+            async with semaphore:
+                return await asyncio.to_thread(self.fetch, url)
+
+        return await asyncio.gather(*(fetch_one(url) for url in urls))
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+_batch_fetchers = {}
+_batch_fetchers_lock = threading.Lock()
+
+def fetch_api_data_batch(urls, **options):
+    key = tuple(sorted(options.items()))
+    with _batch_fetchers_lock:
+        fetcher = _batch_fetchers.get(key)
+        if fetcher is None:
+            fetcher = _batch_fetchers[key] = BatchFetcher(**options)
+    return fetcher.fetch_many(urls)
+
+# বেঞ্চমার্কের জন্য লোকাল স্ট্যান্ড-ইন সার্ভার: HTTP/1.1 keep-alive সহ jsonplaceholder এর মতো posts দেয়
+def serve_fake_posts(count=100, port=0):
+    payload = json.dumps([
+        {'userId': 1, 'id': i, 'title': f"post {i} " * 10, 'body': f"body of post {i}"}
+        for i in range(1, count + 1)
+    ]).encode('utf-8')
+
+    class PostsHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', port), PostsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/posts"
+
+# টেস্ট কেস
+# server, url = serve_fake_posts()
+# results = fetch_api_data_batch([f"{url}?page={i}" for i in range(1000)], concurrency=64)
+# print(len(results), results[0][0]['id'])  # 1000 1
+# server.shutdown()